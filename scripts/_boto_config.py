@@ -0,0 +1,15 @@
+"""Shared botocore configuration for the CI helper scripts.
+
+Every Step Functions client created by the scripts uses ``SFN_CONFIG`` so they
+get a larger connection pool, adaptive retries (which absorb
+``ThrottlingException`` without custom code) and bounded timeouts.
+"""
+
+from botocore.config import Config
+
+SFN_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 5},
+    connect_timeout=5,
+    read_timeout=10,
+)
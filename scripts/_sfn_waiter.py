@@ -0,0 +1,92 @@
+"""Client-side waiter for Step Functions executions.
+
+boto3 does not ship a waiter for ``DescribeExecution``, so the CI scripts poll
+it themselves. This module keeps that logic (backoff, jitter, terminal states
+and eventual-consistency retries) in one place so every script that needs to
+wait for an execution shares the same tuning.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+TERMINAL_STATES = frozenset(("SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED"))
+
+
+@dataclass(frozen=True)
+class WaiterConfig:
+    """Polling parameters, named after boto3's ``WaiterConfig`` keys.
+
+    ``Delay`` is the initial polling interval, which doubles after every
+    non-terminal response up to ``MaxDelay``. ``MaxAttempts`` bounds the number
+    of ``describe_execution`` calls (``None`` means only ``Timeout`` applies).
+    """
+
+    Delay: float = 0.05
+    MaxDelay: float = 5.0
+    MaxAttempts: Optional[int] = None
+    Timeout: float = 120
+    # Extra polls allowed when the execution reports SUCCEEDED but its output
+    # is not yet visible through the API.
+    OutputRetries: int = 3
+
+
+DEFAULT_CONFIG = WaiterConfig()
+
+
+class ExecutionCompletedWaiter:
+    """Wait for a Step Functions execution to reach a terminal state."""
+
+    def __init__(self, client, backoff: float = 2.0):
+        self.client = client
+        self.backoff = backoff
+
+    def wait(self, execution_arn: str, config: WaiterConfig = DEFAULT_CONFIG) -> Dict[str, Any]:
+        """Poll ``describe_execution`` until the execution finishes.
+
+        Returns the final ``describe_execution`` response. If the budget runs
+        out while waiting for the output of a ``SUCCEEDED`` execution, the last
+        terminal response is returned as is. Raises ``TimeoutError`` when the
+        timeout or attempt budget is exhausted before any terminal status.
+        """
+
+        _now = time.monotonic
+        _sleep = time.sleep
+        _uniform = random.uniform
+        _describe = self.client.describe_execution
+
+        deadline = _now() + config.Timeout
+        delay = config.Delay
+        output_retries = config.OutputRetries
+        attempts = 0
+        terminal_response = None
+
+        while _now() < deadline:
+            response = _describe(executionArn=execution_arn)
+            attempts += 1
+            status = response["status"]
+
+            if status in TERMINAL_STATES:
+                # A succeeded execution without output is treated as not ready
+                # yet, since the API may lag behind the state change.
+                if status != "SUCCEEDED" or "output" in response or output_retries <= 0:
+                    return response
+                output_retries -= 1
+                terminal_response = response
+
+            if config.MaxAttempts is not None and attempts >= config.MaxAttempts:
+                break
+
+            _sleep(_uniform(0, min(config.MaxDelay, delay)))
+            delay = min(config.MaxDelay, delay * self.backoff)
+
+        if terminal_response is not None:
+            return terminal_response
+
+        raise TimeoutError(
+            f"Execution {execution_arn} did not finish within {config.Timeout} seconds "
+            f"({attempts} attempts)"
+        )
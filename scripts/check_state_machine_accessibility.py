@@ -15,67 +15,98 @@ import sys
 import time
 from typing import Any, Dict
 
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
+from _sfn_waiter import ExecutionCompletedWaiter, WaiterConfig
+
+_SAMPLE_INPUT = {
+    "requestId": "healthcheck-request",
+    "inputData": {
+        "value": "healthcheck",
+        "metadata": {
+            "source": "ci-healthcheck",
+            "timestamp": "2024-01-01T00:00:00Z",
+        },
+    },
+}
+_SAMPLE_INPUT_JSON = json.dumps(_SAMPLE_INPUT, separators=(",", ":"))
 
 
 def _create_client(endpoint: str, region: str, access_key: str, secret_key: str):
     """Create a Step Functions client that targets the local endpoint."""
 
+    # Imported lazily so misconfigured runs exit before paying for boto3.
+    import boto3
+
+    from _boto_config import SFN_CONFIG
+
     return boto3.client(
         "stepfunctions",
         endpoint_url=endpoint,
         region_name=region,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
+        config=SFN_CONFIG,
     )
 
 
-def _wait_for_execution(client, execution_arn: str, timeout: int = 120, poll: int = 2) -> Dict[str, Any]:
+def _wait_for_execution(
+    client,
+    execution_arn: str,
+    timeout: int = 120,
+    initial_poll: float = 0.05,
+    max_poll: float = 5.0,
+    backoff: float = 2.0,
+) -> Dict[str, Any]:
     """Poll the execution until a terminal state is reached or timeout occurs."""
 
-    deadline = time.time() + timeout
+    config = WaiterConfig(Delay=initial_poll, MaxDelay=max_poll, Timeout=timeout)
+    return ExecutionCompletedWaiter(client, backoff=backoff).wait(execution_arn, config=config)
 
-    while time.time() < deadline:
-        response = client.describe_execution(executionArn=execution_arn)
-        status = response["status"]
 
-        if status in {"SUCCEEDED", "FAILED", "TIMED_OUT", "ABORTED"}:
-            return response
+def _count_history_events(client, execution_arn: str) -> int:
+    """Count execution history events page by page without keeping them in memory."""
 
-        time.sleep(poll)
-
-    raise TimeoutError(f"Execution {execution_arn} did not finish within {timeout} seconds")
+    paginator = client.get_paginator("get_execution_history")
+    return sum(
+        len(page["events"])
+        for page in paginator.paginate(executionArn=execution_arn, maxResults=1000)
+    )
 
 
 def _run_smoke_test(client, state_machine_arn: str) -> Dict[str, Any]:
-    """Start a workflow execution and validate the final output."""
-
-    sample_input = {
-        "requestId": "healthcheck-request",
-        "inputData": {
-            "value": "healthcheck",
-            "metadata": {
-                "source": "ci-healthcheck",
-                "timestamp": "2024-01-01T00:00:00Z",
-            },
-        },
-    }
+    """Start a workflow execution and validate the final output.
+
+    The execution history is only fetched when the execution did not succeed or
+    when ``SMOKE_INCLUDE_HISTORY=1`` is set, keeping the happy path to a single
+    round-trip after completion.
+    """
 
     execution_response = client.start_execution(
         stateMachineArn=state_machine_arn,
         name=f"healthcheck-{int(time.time())}",
-        input=json.dumps(sample_input),
+        input=_SAMPLE_INPUT_JSON,
     )
 
     execution_arn = execution_response["executionArn"]
     final_status = _wait_for_execution(client, execution_arn)
+    succeeded = final_status["status"] == "SUCCEEDED"
+
+    if not succeeded:
+        from botocore.exceptions import BotoCoreError, ClientError
 
-    if final_status["status"] != "SUCCEEDED":
+        # A failing history fetch must not mask the execution status.
+        try:
+            history_note = f"{_count_history_events(client, execution_arn)} execution history events"
+        except (ClientError, BotoCoreError) as exc:
+            history_note = f"execution history unavailable: {exc}"
         raise RuntimeError(
-            f"State machine execution ended in non-success status: {final_status['status']}"
+            f"State machine execution ended in non-success status: {final_status['status']} "
+            f"({history_note})"
         )
 
+    history_event_count = None
+    if os.environ.get("SMOKE_INCLUDE_HISTORY") == "1":
+        history_event_count = _count_history_events(client, execution_arn)
+
     output_payload = json.loads(final_status.get("output", "{}"))
 
     final_result = output_payload.get("finalResult", {})
@@ -85,7 +116,7 @@ def _run_smoke_test(client, state_machine_arn: str) -> Dict[str, Any]:
     return {
         "executionArn": execution_arn,
         "output": output_payload,
-        "history": client.get_execution_history(executionArn=execution_arn).get("events", []),
+        "history_event_count": history_event_count,
     }
 
 
@@ -100,6 +131,8 @@ def main() -> int:
         print("❌ STATE_MACHINE_ARN environment variable is not set")
         return 1
 
+    from botocore.exceptions import BotoCoreError, ClientError
+
     try:
         client = _create_client(endpoint, region, access_key, secret_key)
         state_machine = client.describe_state_machine(stateMachineArn=state_machine_arn)
@@ -114,7 +147,8 @@ def main() -> int:
             "  Final result key:",
             smoke_test_result["output"].get("finalResult", {}).get("finalValue", "<missing>"),
         )
-        print(f"  Observed {len(smoke_test_result['history'])} execution history events")
+        if smoke_test_result["history_event_count"] is not None:
+            print(f"  Observed {smoke_test_result['history_event_count']} execution history events")
 
         return 0
     except (ClientError, BotoCoreError, TimeoutError, RuntimeError) as exc:
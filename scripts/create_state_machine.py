@@ -4,8 +4,8 @@ Step Functions ステートマシン作成スクリプト
 GitHub Actions環境でStep Functions Localにステートマシンを作成
 """
 
-import boto3
 import json
+import re
 import sys
 import os
 import time
@@ -16,8 +16,12 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 
-def create_state_machine():
-    """ステートマシンの作成"""
+def create_state_machine(client):
+    """ステートマシンの作成
+
+    Args:
+        client: wait_for_stepfunctions_localが返したStep Functionsクライアント
+    """
     try:
         logger.info("Creating Step Functions state machine...")
         
@@ -44,31 +48,29 @@ def create_state_machine():
             'ProcessState3FunctionArn': f'arn:aws:lambda:us-east-1:123456789012:function:{stack_name}-ProcessState3-{environment}'
         }
         
-        # プレースホルダーを実際のARNに置換
-        definition = definition_template
+        # プレースホルダーを実際のARNに置換（全プレースホルダーを1パスで置換）
+        placeholder_pattern = re.compile(
+            r"\$\{(" + "|".join(re.escape(k) for k in local_function_arns) + r")\}"
+        )
+        replaced = set()
+        
+        def _substitute(match):
+            replaced.add(match.group(1))
+            return local_function_arns[match.group(1)]
+        
+        definition = placeholder_pattern.sub(_substitute, definition_template)
+        # テンプレートに実際に含まれていたプレースホルダーのみログ出力
         for placeholder, arn in local_function_arns.items():
-            old_placeholder = f"${{{placeholder}}}"
-            definition = definition.replace(old_placeholder, arn)
-            logger.info(f"Replaced {old_placeholder} with {arn}")
+            if placeholder in replaced:
+                logger.info(f"Replaced ${{{placeholder}}} with {arn}")
         
         logger.info("Substituted Lambda function ARNs for local testing")
         
         # 置換後の定義をログ出力（デバッグ用）
         logger.info("Final state machine definition created with local Lambda ARNs")
         
-        # Step Functions Localクライアントの作成
-        stepfunctions_endpoint = os.getenv('STEPFUNCTIONS_ENDPOINT', 'http://localhost:8083')
-        
-        client = boto3.client(
-            'stepfunctions',
-            endpoint_url=stepfunctions_endpoint,
-            region_name='us-east-1',
-            aws_access_key_id='dummy',
-            aws_secret_access_key='dummy'
-        )
-        
         # 接続テスト
-        logger.info(f"Testing connection to Step Functions Local at {stepfunctions_endpoint}")
+        logger.info(f"Testing connection to Step Functions Local at {client.meta.endpoint_url}")
         try:
             client.list_state_machines()
             logger.info("✓ Successfully connected to Step Functions Local")
@@ -98,43 +100,57 @@ def create_state_machine():
         
         logger.info(f"State machine ARN saved to {arn_file}")
         
-        # 作成されたステートマシンの確認
-        logger.info("Verifying created state machine...")
-        try:
-            describe_response = client.describe_state_machine(stateMachineArn=state_machine_arn)
-            logger.info(f"✓ State machine verification successful")
-            logger.info(f"  Name: {describe_response['name']}")
-            logger.info(f"  Status: {describe_response['status']}")
-            logger.info(f"  Creation Date: {describe_response['creationDate']}")
-        except Exception as e:
-            logger.warning(f"State machine verification failed: {e}")
+        logger.info(f"  Name: {state_machine_name}")
+        logger.info(f"  Creation Date: {response.get('creationDate')}")
+        
+        # 作成されたステートマシンの確認（VERIFY_STATE_MACHINE=1の場合のみ）
+        if os.getenv('VERIFY_STATE_MACHINE') == '1':
+            logger.info("Verifying created state machine...")
+            try:
+                describe_response = client.describe_state_machine(stateMachineArn=state_machine_arn)
+                logger.info(f"✓ State machine verification successful")
+                logger.info(f"  Name: {describe_response['name']}")
+                logger.info(f"  Status: {describe_response['status']}")
+                logger.info(f"  Creation Date: {describe_response['creationDate']}")
+            except Exception as e:
+                logger.warning(f"State machine verification failed: {e}")
         
         return True
         
     except Exception as e:
-        logger.error(f"Error creating state machine: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error creating state machine: {e}")
         return False
 
 
 def wait_for_stepfunctions_local(endpoint: str, max_attempts: int = 30, delay: int = 2):
-    """Step Functions Localの起動を待機"""
+    """Step Functions Localの起動を待機
+
+    Returns:
+        起動を確認できた場合はそのまま再利用できるクライアント、失敗時はNone
+    """
     logger.info(f"Waiting for Step Functions Local at {endpoint}...")
     
+    # boto3は重いため、実際にクライアントが必要になるまでインポートを遅延する
+    import boto3
+    
+    from _boto_config import SFN_CONFIG
+    
+    # クライアントは1回だけ作成し、リトライ間で接続プールを共有する
+    session = boto3.session.Session()
+    client = session.client(
+        'stepfunctions',
+        endpoint_url=endpoint,
+        region_name='us-east-1',
+        aws_access_key_id='dummy',
+        aws_secret_access_key='dummy',
+        config=SFN_CONFIG
+    )
+    
     for attempt in range(1, max_attempts + 1):
         try:
-            client = boto3.client(
-                'stepfunctions',
-                endpoint_url=endpoint,
-                region_name='us-east-1',
-                aws_access_key_id='dummy',
-                aws_secret_access_key='dummy'
-            )
-            
             client.list_state_machines()
             logger.info(f"✓ Step Functions Local is ready (attempt {attempt})")
-            return True
+            return client
             
         except Exception as e:
             if attempt < max_attempts:
@@ -143,9 +159,9 @@ def wait_for_stepfunctions_local(endpoint: str, max_attempts: int = 30, delay: i
             else:
                 logger.error(f"Step Functions Local failed to start after {max_attempts} attempts")
                 logger.error(f"Last error: {e}")
-                return False
+                return None
     
-    return False
+    return None
 
 
 def main():
@@ -156,12 +172,13 @@ def main():
         # Step Functions Localの起動待機
         stepfunctions_endpoint = os.getenv('STEPFUNCTIONS_ENDPOINT', 'http://localhost:8083')
         
-        if not wait_for_stepfunctions_local(stepfunctions_endpoint):
+        client = wait_for_stepfunctions_local(stepfunctions_endpoint)
+        if client is None:
             logger.error("❌ Step Functions Local is not available")
             sys.exit(1)
         
         # ステートマシンの作成
-        if create_state_machine():
+        if create_state_machine(client):
             logger.info("🎉 State machine creation completed successfully!")
             sys.exit(0)
         else:
@@ -172,9 +189,7 @@ def main():
         logger.info("⏹️ State machine creation interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {e}")
-        import traceback
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"💥 Unexpected error: {e}")
         sys.exit(1)
 
 
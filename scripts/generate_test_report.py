@@ -8,14 +8,35 @@ import json
 import xml.etree.ElementTree as ET
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None
+
 # ログ設定
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# このサイズを超える統合テスト結果はijsonでストリーミング解析する
+_STREAMING_JSON_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# CIレポートに含める環境変数
+_RELEVANT_ENV_VARS = frozenset({
+    'CI', 'GITHUB_ACTIONS', 'GITHUB_WORKFLOW', 'GITHUB_RUN_ID',
+    'GITHUB_REPOSITORY', 'GITHUB_SHA', 'GITHUB_REF',
+    'STEPFUNCTIONS_ENDPOINT', 'STATE_MACHINE_ARN'
+})
+
 
 def parse_pytest_results(xml_file: str) -> Optional[Dict[str, Any]]:
     """pytest結果XMLファイルの解析"""
@@ -24,13 +45,56 @@ def parse_pytest_results(xml_file: str) -> Optional[Dict[str, Any]]:
             logger.warning(f"pytest results file not found: {xml_file}")
             return None
         
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
+        totals = None
+        test_cases = []
+        # 親要素のスタック（処理済みtestcaseを親から外してメモリを解放するため）
+        parents = []
+        
+        # iterparseで1パスのストリーミング解析を行い、メモリ使用量を一定に保つ
+        with open(xml_file, 'rb') as f:
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    if totals is None and elem.tag in ('testsuites', 'testsuite') and 'tests' in elem.attrib:
+                        totals = dict(elem.attrib)
+                    parents.append(elem)
+                    continue
+                
+                parents.pop()
+                if elem.tag != 'testcase':
+                    continue
+                
+                # 個別テストケースの詳細
+                test_detail = {
+                    'name': elem.get('name'),
+                    'class': elem.get('classname'),
+                    'duration_seconds': float(elem.get('time', 0)),
+                    'status': 'passed'
+                }
+                
+                # 失敗・エラーの確認
+                failure = elem.find('failure')
+                error = elem.find('error')
+                
+                if failure is not None:
+                    test_detail['status'] = 'failed'
+                    test_detail['message'] = failure.get('message', '')
+                    test_detail['details'] = failure.text or ''
+                elif error is not None:
+                    test_detail['status'] = 'error'
+                    test_detail['message'] = error.get('message', '')
+                    test_detail['details'] = error.text or ''
+                
+                test_cases.append(test_detail)
+                
+                elem.clear()
+                if parents:
+                    parents[-1].remove(elem)
         
-        total_tests = int(root.get('tests', 0))
-        failures = int(root.get('failures', 0))
-        errors = int(root.get('errors', 0))
-        skipped = int(root.get('skipped', 0))
+        totals = totals or {}
+        total_tests = int(totals.get('tests', 0))
+        failures = int(totals.get('failures', 0))
+        errors = int(totals.get('errors', 0))
+        skipped = int(totals.get('skipped', 0))
         passed = total_tests - failures - errors - skipped
         
         pytest_results = {
@@ -41,37 +105,9 @@ def parse_pytest_results(xml_file: str) -> Optional[Dict[str, Any]]:
                 'skipped': skipped,
                 'success_rate': f'{(passed/total_tests*100):.1f}%' if total_tests > 0 else '0%'
             },
-            'test_cases': []
+            'test_cases': test_cases
         }
         
-        # 個別テストケースの詳細
-        for testcase in root.findall('.//testcase'):
-            test_name = testcase.get('name')
-            class_name = testcase.get('classname')
-            time_taken = float(testcase.get('time', 0))
-            
-            test_detail = {
-                'name': test_name,
-                'class': class_name,
-                'duration_seconds': time_taken,
-                'status': 'passed'
-            }
-            
-            # 失敗・エラーの確認
-            failure = testcase.find('failure')
-            error = testcase.find('error')
-            
-            if failure is not None:
-                test_detail['status'] = 'failed'
-                test_detail['message'] = failure.get('message', '')
-                test_detail['details'] = failure.text or ''
-            elif error is not None:
-                test_detail['status'] = 'error'
-                test_detail['message'] = error.get('message', '')
-                test_detail['details'] = error.text or ''
-            
-            pytest_results['test_cases'].append(test_detail)
-        
         logger.info(f"✓ Parsed pytest results: {total_tests} tests, {passed} passed, {failures + errors} failed")
         return pytest_results
         
@@ -87,11 +123,16 @@ def parse_integration_test_results(json_file: str) -> Optional[Dict[str, Any]]:
             logger.warning(f"Integration test results file not found: {json_file}")
             return None
         
-        with open(json_file, 'r', encoding='utf-8') as f:
-            integration_data = json.load(f)
-        
-        # 統合テスト結果の抽出
-        integration_report = integration_data.get('integration_test_report', {})
+        if ijson is not None and os.path.getsize(json_file) > _STREAMING_JSON_THRESHOLD_BYTES:
+            # 大きなファイルは必要なサブツリーのみをストリーミングで抽出
+            with open(json_file, 'rb') as f:
+                integration_report = next(ijson.items(f, 'integration_test_report', use_float=True), {})
+        else:
+            with open(json_file, 'r', encoding='utf-8') as f:
+                integration_data = json.load(f)
+            
+            # 統合テスト結果の抽出
+            integration_report = integration_data.get('integration_test_report', {})
         
         logger.info("✓ Parsed integration test results")
         return integration_report
@@ -101,46 +142,63 @@ def parse_integration_test_results(json_file: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _tail(path: str, n: int = 10, block: int = 8192) -> List[str]:
+    """ファイル末尾からn行を取得（末尾のブロックのみ読み込む）"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b''
+        
+        # n行分の改行が見つかるかファイル先頭に達するまで後方へ読み進める
+        while pos > 0 and data.count(b'\n') <= n:
+            read_size = min(block, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+    
+    lines = data.splitlines(keepends=True)
+    # ファイル途中から読んだ場合、先頭の行は欠けている可能性がある
+    if pos > 0:
+        lines = lines[1:]
+    return [line.decode('utf-8', errors='replace').rstrip('\r\n') for line in lines[-n:]]
+
+
 def collect_log_files() -> List[Dict[str, Any]]:
     """ログファイルの収集"""
     log_files = []
     
-    # 収集対象のログファイル
-    log_patterns = [
-        'workflow_test.log',
-        'integration_test.log',
-        '*.log'
-    ]
-    
     try:
-        import glob
+        # カレントディレクトリの*.logを1回のscandirで列挙（DirEntryのstat結果を再利用）
+        with os.scandir('.') as it:
+            entries = [e for e in it if e.is_file(follow_symlinks=False) and e.name.endswith('.log')]
         
-        for pattern in log_patterns:
-            for log_file in glob.glob(pattern):
-                if os.path.exists(log_file):
-                    try:
-                        file_size = os.path.getsize(log_file)
-                        modified_time = datetime.fromtimestamp(os.path.getmtime(log_file))
-                        
-                        log_info = {
-                            'filename': log_file,
-                            'size_bytes': file_size,
-                            'modified_at': modified_time.isoformat(),
-                            'available': True
-                        }
-                        
-                        # ログファイルの最後の数行を取得（エラー確認用）
-                        try:
-                            with open(log_file, 'r', encoding='utf-8') as f:
-                                lines = f.readlines()
-                                log_info['last_lines'] = lines[-10:] if len(lines) > 10 else lines
-                        except Exception:
-                            log_info['last_lines'] = []
-                        
-                        log_files.append(log_info)
-                        
-                    except Exception as e:
-                        logger.warning(f"Error reading log file {log_file}: {e}")
+        for entry in entries:
+            log_file = entry.name
+            try:
+                # scandir時に取得済みのstat結果を使う（ファイルが消えていればスキップ）
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except FileNotFoundError:
+                    continue
+                modified_time = datetime.fromtimestamp(st.st_mtime)
+                
+                log_info = {
+                    'filename': log_file,
+                    'size_bytes': st.st_size,
+                    'modified_at': modified_time.isoformat(),
+                    'available': True
+                }
+                
+                # ログファイルの最後の数行を取得（エラー確認用）
+                try:
+                    log_info['last_lines'] = _tail(log_file, 10)
+                except Exception:
+                    log_info['last_lines'] = []
+                
+                log_files.append(log_info)
+                
+            except Exception as e:
+                logger.warning(f"Error reading log file {log_file}: {e}")
         
         logger.info(f"✓ Collected {len(log_files)} log files")
         
@@ -171,17 +229,11 @@ def detect_ci_environment() -> Dict[str, Any]:
         else:
             ci_info['platform'] = 'local'
         
-        # 関連する環境変数の収集
-        relevant_env_vars = [
-            'CI', 'GITHUB_ACTIONS', 'GITHUB_WORKFLOW', 'GITHUB_RUN_ID',
-            'GITHUB_REPOSITORY', 'GITHUB_SHA', 'GITHUB_REF',
-            'STEPFUNCTIONS_ENDPOINT', 'STATE_MACHINE_ARN'
-        ]
-        
-        for var in relevant_env_vars:
-            value = os.getenv(var)
-            if value:
-                ci_info['environment_variables'][var] = value
+        # 関連する環境変数の収集（空の値は除外）
+        env = os.environ
+        ci_info['environment_variables'] = {
+            var: env[var] for var in sorted(_RELEVANT_ENV_VARS & env.keys()) if env[var]
+        }
         
         logger.info(f"✓ Detected CI environment: {ci_info['platform']}")
         
@@ -195,11 +247,17 @@ def generate_comprehensive_report() -> Dict[str, Any]:
     """包括的テストレポートの生成"""
     logger.info("🔄 Generating comprehensive test report...")
     
-    # 各種データの収集
-    pytest_results = parse_pytest_results('test-results.xml')
-    integration_results = parse_integration_test_results('integration_test_report.json')
-    log_files = collect_log_files()
-    ci_environment = detect_ci_environment()
+    # 各種データの収集（互いに独立したI/O処理のため並行実行）
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        pytest_future = executor.submit(parse_pytest_results, 'test-results.xml')
+        integration_future = executor.submit(parse_integration_test_results, 'integration_test_report.json')
+        log_files_future = executor.submit(collect_log_files)
+        ci_environment_future = executor.submit(detect_ci_environment)
+    
+    pytest_results = pytest_future.result()
+    integration_results = integration_future.result()
+    log_files = log_files_future.result()
+    ci_environment = ci_environment_future.result()
     
     # 包括的レポートの構築
     comprehensive_report = {
@@ -262,8 +320,14 @@ def generate_comprehensive_report() -> Dict[str, Any]:
 def save_report(report: Dict[str, Any], output_file: str):
     """レポートの保存"""
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            # orjsonが利用可能な場合はC実装のシリアライザで書き出す
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(report, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
         
         logger.info(f"✓ Comprehensive report saved to {output_file}")
         
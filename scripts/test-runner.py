@@ -4,14 +4,71 @@ Test runner script for Step Functions Local testing
 Provides detailed test execution and reporting capabilities
 """
 
+import copy
+import functools
+import importlib.util
 import json
 import os
+import re
 import sys
 import subprocess
+import tempfile
 import time
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    # libxml2-backed parser when available; the stdlib module uses the
+    # expat C accelerator otherwise
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+# Counts in pytest's final summary line, e.g. "1 failed, 5 passed in 2.31s"
+_PYTEST_SUMMARY_RE = re.compile(r'(\d+)\s+(passed|failed|errors?)\b', re.IGNORECASE)
+_SUMMARY_KEYS = {'passed': 'passed', 'failed': 'failed', 'error': 'errors', 'errors': 'errors'}
+
+# pytest prints the summary last, so only the tail of stdout is scanned
+_SUMMARY_TAIL_CHARS = 4096
+
+# Amount of pytest output kept in the report
+_OUTPUT_TAIL_BYTES = 64 * 1024
+
+
+def _read_tail(f, max_bytes=_OUTPUT_TAIL_BYTES):
+    """Return the last max_bytes of an open binary file as text, plus the
+    number of bytes cut from the front (marked in the text when non-zero)"""
+    size = f.seek(0, os.SEEK_END)
+    skipped = max(0, size - max_bytes)
+    f.seek(skipped)
+    text = f.read().decode('utf-8', errors='replace')
+    if skipped:
+        text = f"…[truncated {skipped} bytes]\n" + text
+    return text, skipped
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path, mtime):
+    """Parse a JSON config file; cached until the file's mtime changes"""
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        return orjson.loads(Path(config_path).read_bytes())
+    with open(config_path, 'r') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_text_cached(path, mtime):
+    """Read a stripped text file; cached until the file's mtime changes"""
+    with open(path, 'r') as f:
+        return f.read().strip()
+
+
 class TestRunner:
     def __init__(self, config_path="scripts/test-config.json"):
         """Initialize test runner with configuration"""
@@ -30,8 +87,8 @@ class TestRunner:
     def _load_config(self, config_path):
         """Load test configuration"""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            # The cached dict is shared, so each runner gets its own copy
+            return copy.deepcopy(_load_config_cached(config_path, os.path.getmtime(config_path)))
         except FileNotFoundError:
             print(f"❌ Configuration file not found: {config_path}")
             sys.exit(1)
@@ -47,12 +104,15 @@ class TestRunner:
         os.environ['AWS_SECRET_ACCESS_KEY'] = self.config['aws']['secret_access_key']
         
         # Set state machine ARN if available
-        if os.path.exists('state_machine_arn.txt'):
-            with open('state_machine_arn.txt', 'r') as f:
-                os.environ['STATE_MACHINE_ARN'] = f.read().strip()
+        try:
+            arn_mtime = os.path.getmtime('state_machine_arn.txt')
+        except OSError:
+            arn_mtime = None
+        if arn_mtime is not None:
+            os.environ['STATE_MACHINE_ARN'] = _read_text_cached('state_machine_arn.txt', arn_mtime)
     
-    def run_tests(self, test_path="tests/", verbose=True):
-        """Run the test suite"""
+    def run_tests(self, test_path="tests/", verbose=True, ci=False, parallelism=None):
+        """Run the test suite (serially unless parallelism is requested)"""
         print("🧪 Running Step Functions workflow tests...")
         
         # Setup environment
@@ -63,17 +123,44 @@ class TestRunner:
             sys.executable, '-m', 'pytest',
             test_path,
             '--tb=short',
-            '--junit-xml=test-results.xml'
+            '--junit-xml=test-results.xml',
+            # Results come from the XML report, so .pytest_cache is never needed
+            '-p', 'no:cacheprovider'
         ]
         
         if verbose:
             cmd.append('-v')
         
+        # Ephemeral CI containers never rerun from previous state
+        if ci:
+            cmd.extend(['-p', 'no:stepwise', '-p', 'no:lfplugin'])
+        
+        # Spread tests over pytest-xdist workers only when explicitly asked:
+        # the integration tests share one Step Functions Local endpoint and
+        # state_machine_arn.txt. loadscope keeps tests of one module on the
+        # same worker so fixtures are reused.
+        if parallelism is None:
+            parallelism = self.config.get('test', {}).get('parallelism')
+        if parallelism is not None:
+            if importlib.util.find_spec('xdist') is not None:
+                cmd.extend(['-n', str(parallelism), '--dist=loadscope'])
+            else:
+                print("⚠️  pytest-xdist is not installed; running tests serially")
+        
         # Run tests
         start_time = time.time()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
-            execution_time = time.time() - start_time
+            # pytest writes straight to temporary files instead of a pipe, so
+            # its output is never buffered in memory; only the tail is read back
+            with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+                completed = subprocess.run(cmd, stdout=out, stderr=err, timeout=300)
+                execution_time = time.time() - start_time
+                stdout, stdout_skipped = _read_tail(out)
+                stderr, stderr_skipped = _read_tail(err)
+                result = subprocess.CompletedProcess(cmd, completed.returncode, stdout, stderr)
+            
+            self.results['stdout_truncated'] = stdout_skipped > 0
+            self.results['stderr_truncated'] = stderr_skipped > 0
             
             # Parse results
             self._parse_test_results(result, execution_time)
@@ -94,59 +181,56 @@ class TestRunner:
         self.results['stderr'] = result.stderr
         self.results['return_code'] = result.returncode
         
-        # Try to parse XML results if available
-        if os.path.exists('test-results.xml'):
-            self._parse_xml_results()
+        # The XML report is authoritative; stdout is only scanned without it
+        if os.path.exists('test-results.xml') and self._parse_xml_results():
+            return
         
         # Parse from stdout as fallback
-        lines = result.stdout.split('\n')
-        for line in lines:
-            if '=====' in line and 'passed' in line:
-                # Extract summary from pytest output
-                parts = line.split()
-                for i, part in enumerate(parts):
-                    if part.isdigit():
-                        if 'passed' in line:
-                            self.results['summary']['passed'] = int(part)
-                        elif 'failed' in line:
-                            self.results['summary']['failed'] = int(part)
-                        elif 'error' in line:
-                            self.results['summary']['errors'] = int(part)
+        summary = self.results['summary']
+        for count, kind in _PYTEST_SUMMARY_RE.findall(result.stdout[-_SUMMARY_TAIL_CHARS:]):
+            summary[_SUMMARY_KEYS[kind.lower()]] = int(count)
     
     def _parse_xml_results(self):
-        """Parse XML test results"""
+        """Parse XML test results, returning True if a summary was found"""
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse('test-results.xml')
-            root = tree.getroot()
+            # Stream the file and stop at the first element carrying the
+            # summary attributes (<testsuites> or the first <testsuite>), so
+            # the testcase elements are never built in memory.
+            root = None
+            with open('test-results.xml', 'rb') as f:
+                for _, elem in ET.iterparse(f, events=('start',)):
+                    if 'tests' in elem.attrib:
+                        root = elem
+                        break
+            if root is None:
+                return False
             
-            self.results['summary']['total'] = int(root.get('tests', 0))
-            self.results['summary']['failed'] = int(root.get('failures', 0))
-            self.results['summary']['errors'] = int(root.get('errors', 0))
-            self.results['summary']['passed'] = (
-                self.results['summary']['total'] - 
-                self.results['summary']['failed'] - 
-                self.results['summary']['errors']
-            )
+            summary = self.results['summary']
+            total = summary['total'] = int(root.get('tests', 0))
+            failed = summary['failed'] = int(root.get('failures', 0))
+            errors = summary['errors'] = int(root.get('errors', 0))
+            summary['passed'] = total - failed - errors
+            return True
             
         except Exception as e:
             print(f"⚠️  Could not parse XML results: {e}")
+            return False
     
     def generate_report(self, output_file="test-report.json"):
         """Generate detailed test report"""
         # Calculate success rate
-        total = self.results['summary']['total']
-        passed = self.results['summary']['passed']
-        
-        if total > 0:
-            success_rate = (passed / total) * 100
-            self.results['summary']['success_rate'] = f"{success_rate:.1f}%"
-        else:
-            self.results['summary']['success_rate'] = "0%"
+        summary = self.results['summary']
+        total = summary['total']
+        summary['success_rate'] = f"{summary['passed'] / total * 100:.1f}%" if total > 0 else "0%"
         
         # Save report
-        with open(output_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        if orjson is not None:
+            Path(output_file).write_bytes(
+                orjson.dumps(self.results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         print(f"📊 Test report saved to: {output_file}")
     
@@ -189,6 +273,10 @@ def main():
                        help='Output file for test report')
     parser.add_argument('--quiet', action='store_true',
                        help='Run tests in quiet mode')
+    parser.add_argument('--ci', action='store_true',
+                       help='Disable pytest plugins that are only useful for local reruns')
+    parser.add_argument('--parallelism',
+                       help='Run tests on this many pytest-xdist workers (e.g. 4 or auto)')
     
     args = parser.parse_args()
     
@@ -196,7 +284,8 @@ def main():
     runner = TestRunner(args.config)
     
     # Run tests
-    success = runner.run_tests(args.test_path, verbose=not args.quiet)
+    success = runner.run_tests(args.test_path, verbose=not args.quiet, ci=args.ci,
+                               parallelism=args.parallelism)
     
     # Generate report
     runner.generate_report(args.output)
@@ -0,0 +1,140 @@
+"""
+JSONシリアライズ・スキーマ検証用ユーティリティ
+orjson / fastjsonschemaが利用可能な場合は高速な実装を使用し、なければ標準ライブラリにフォールバック
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+from collections.abc import Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is optional
+    fastjsonschema = None
+
+# SKIP_VALIDATION=1の場合に、コンテナごとに検証を行う呼び出し回数
+FULL_VALIDATION_INVOCATIONS = 3
+
+
+def dumps_bytes(obj) -> bytes:
+    """
+    オブジェクトをコンパクトなJSON（UTF-8バイト列）にシリアライズ
+    
+    Args:
+        obj: シリアライズ対象
+        
+    Returns:
+        bytes: JSONバイト列
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str).encode('utf-8')
+
+
+def dumps(obj) -> str:
+    """
+    オブジェクトをコンパクトなJSON文字列にシリアライズ（ログ出力用）
+    
+    Args:
+        obj: シリアライズ対象
+        
+    Returns:
+        str: JSON文字列
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def dumped_size(obj) -> int:
+    """
+    JSONシリアライズ後のバイト数を取得
+    
+    Args:
+        obj: 計測対象
+        
+    Returns:
+        int: JSONのバイト数
+    """
+    return len(dumps_bytes(obj))
+
+
+class LazyJSON:
+    """
+    ログ出力時にはじめてJSONへシリアライズするラッパー
+    
+    logger.info("...: %s", LazyJSON(event)) のように渡すと、
+    該当レベルのログが実際に出力される場合のみシリアライズされる
+    """
+    
+    __slots__ = ('obj',)
+    
+    def __init__(self, obj):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return dumps(self.obj)
+
+
+def compile_schema(schema: dict) -> Callable[[object], str | None] | None:
+    """
+    JSONスキーマを検証関数にコンパイル（モジュール読み込み時に1回だけ呼び出す想定）
+    
+    Args:
+        schema: JSONスキーマ
+        
+    Returns:
+        Callable | None: データを受け取り、エラーメッセージ（正常時はNone）を返す関数。
+            fastjsonschemaが利用できない場合はNone
+    """
+    if fastjsonschema is None:
+        return None
+    
+    validate = fastjsonschema.compile(schema)
+    
+    def check(data: object) -> str | None:
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException as e:
+            return e.message
+        return None
+    
+    return check
+
+
+def validate_while_warming(func: Callable[[dict], bool]) -> Callable[[dict], bool]:
+    """
+    SKIP_VALIDATION=1の場合に、コンテナごとに最初の数回だけ検証を行うようにするデコレータ
+    
+    ウォーム呼び出しのオーバーヘッドは減るが、不正な入力はValueErrorではなく
+    後続処理のKeyError等として失敗する。環境変数はデコレート時（モジュール読み込み時）に評価する
+    
+    Args:
+        func: イベントを受け取り検証結果を返す関数
+        
+    Returns:
+        Callable: SKIP_VALIDATIONが無効な場合はfuncそのもの。有効な場合は
+            FULL_VALIDATION_INVOCATIONS回を超えた呼び出しでTrueを返すラッパー
+    """
+    if os.environ.get('SKIP_VALIDATION') != '1':
+        return func
+    
+    validation_count = 0
+    
+    @functools.wraps(func)
+    def wrapper(event: dict) -> bool:
+        nonlocal validation_count
+        if validation_count >= FULL_VALIDATION_INVOCATIONS:
+            return True
+        validation_count += 1
+        return func(event)
+    
+    return wrapper
@@ -3,17 +3,37 @@ State1 Lambda Function
 初期入力データを受け取り、処理してState2に渡すLambda関数
 """
 
+from __future__ import annotations
+
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any
+
+try:
+    from json_utils import LazyJSON, compile_schema, validate_while_warming
+except ImportError:  # pragma: no cover - fallback for package imports
+    from .json_utils import LazyJSON, compile_schema, validate_while_warming
 
 # ログ設定
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# 入力イベントの必須フィールド
+_STATE1_REQUIRED = frozenset(('requestId', 'inputData'))
+
+# 入力イベントのスキーマ（fastjsonschemaがあればインポート時に1回だけコンパイル）
+_STATE1_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'inputData'],
+    'properties': {
+        'inputData': {'type': 'object', 'required': ['value']}
+    }
+}
+_schema_errors = compile_schema(_STATE1_SCHEMA)
+
 
-def validate_input(event: Dict[str, Any]) -> bool:
+@validate_while_warming
+def validate_input(event: dict) -> bool:
     """
     入力データの検証
     
@@ -23,12 +43,17 @@ def validate_input(event: Dict[str, Any]) -> bool:
     Returns:
         bool: 検証結果
     """
-    required_fields = ['requestId', 'inputData']
-    
-    for field in required_fields:
-        if field not in event:
-            logger.error(f"Required field '{field}' is missing from input")
+    if _schema_errors is not None:
+        error = _schema_errors(event)
+        if error:
+            logger.error("Input validation error: %s", error)
             return False
+        return True
+    
+    missing = _STATE1_REQUIRED - event.keys()
+    if missing:
+        logger.error("Required fields %s are missing from input", sorted(missing))
+        return False
     
     if not isinstance(event['inputData'], dict):
         logger.error("inputData must be a dictionary")
@@ -41,25 +66,31 @@ def validate_input(event: Dict[str, Any]) -> bool:
     return True
 
 
-def process_input_data(input_data: Dict[str, Any]) -> Dict[str, Any]:
+def process_input_data(input_data: dict, now_iso: str) -> dict:
     """
     入力データの処理
     
     Args:
         input_data: 処理対象の入力データ
+        now_iso: 呼び出し単位でキャッシュした現在時刻（ISO形式）
         
     Returns:
-        Dict: 処理済みデータ
+        dict: 処理済みデータ
     """
-    processed_value = f"State1_processed_{input_data['value']}"
+    value = input_data['value']
+    # 文字列の場合は単純な連結で済ませ、それ以外のみフォーマットする
+    if isinstance(value, str):
+        processed_value = "State1_processed_" + value
+    else:
+        processed_value = f"State1_processed_{value}"
     
     return {
         'processedValue': processed_value,
-        'originalInput': input_data['value'],
+        'originalInput': value,
         'inputMetadata': input_data.get('metadata', {}),
         'processingDetails': {
             'transformationType': 'prefix_addition',
-            'processingTime': datetime.now().isoformat()
+            'processingTime': now_iso
         }
     }
 
@@ -73,17 +104,20 @@ def lambda_handler(event, context):
         context: Lambda実行コンテキスト
         
     Returns:
-        Dict: State2への出力データ
+        dict: State2への出力データ
     """
+    # 現在時刻は1回の呼び出しにつき1回だけ取得して使い回す
+    now_iso = datetime.now().isoformat()
+    
     try:
-        logger.info(f"State1 Lambda function started with event: {json.dumps(event)}")
+        logger.info("State1 Lambda function started with event: %s", LazyJSON(event))
         
         # 入力データの検証
         if not validate_input(event):
             raise ValueError("Input validation failed")
         
         # 入力データの処理
-        processed_data = process_input_data(event['inputData'])
+        processed_data = process_input_data(event['inputData'], now_iso)
         
         # メタデータの追加
         output = {
@@ -91,26 +125,26 @@ def lambda_handler(event, context):
             'state1Output': processed_data,
             'stateMetadata': {
                 'state': 'State1',
-                'executionTime': datetime.now().isoformat(),
+                'executionTime': now_iso,
                 'functionName': context.function_name if context else 'local_test',
                 'requestId': context.aws_request_id if context else 'test_request_id'
             }
         }
         
-        logger.info(f"State1 processing completed successfully")
-        logger.info(f"Output: {json.dumps(output)}")
+        logger.info("State1 processing completed successfully")
+        logger.info("Output: %s", LazyJSON(output))
         
         return output
         
     except Exception as e:
-        logger.error(f"Error in State1 Lambda function: {str(e)}")
+        logger.error("Error in State1 Lambda function: %s", e)
         
         # エラー情報を含む出力
         error_output = {
             'error': {
                 'type': 'State1ExecutionError',
                 'message': str(e),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'input': event
             }
         }
@@ -3,17 +3,52 @@ State2 Lambda Function
 State1からの出力を受け取り、中間処理を行うLambda関数
 """
 
+from __future__ import annotations
+
 import json
 import logging
+import os
 from datetime import datetime
-from typing import Dict, Any
+
+try:
+    from json_utils import LazyJSON, compile_schema, dumped_size, validate_while_warming
+except ImportError:  # pragma: no cover - fallback for package imports
+    from .json_utils import LazyJSON, compile_schema, dumped_size, validate_while_warming
 
 # ログ設定
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# State1出力の必須フィールド
+_STATE2_REQUIRED = frozenset(('requestId', 'state1Output', 'stateMetadata'))
+_STATE1_OUTPUT_REQUIRED = frozenset(('processedValue', 'originalInput'))
+
+# State1出力のスキーマ（fastjsonschemaがあればインポート時に1回だけコンパイル）
+_STATE2_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'state1Output', 'stateMetadata'],
+    'properties': {
+        'state1Output': {'type': 'object', 'required': ['processedValue', 'originalInput']},
+        'stateMetadata': {
+            'type': 'object',
+            'required': ['state'],
+            'properties': {'state': {'const': 'State1'}}
+        }
+    }
+}
+_schema_errors = compile_schema(_STATE2_SCHEMA)
+
+# デバッグ用にState1の出力をそのまま後続へ引き継ぐかどうか
+# （既定では後続ステートが参照するフィールドのみを引き継ぎ、ペイロードを縮小する）
+_INCLUDE_FULL_STATE_HISTORY = os.environ.get('INCLUDE_FULL_STATE_HISTORY') == '1'
+
+# 出力に含める不変の定数（呼び出しごとにリストを生成しないようタプルで共有）
+_PROCESSING_CHAIN = ('State1', 'State2')
+_PREVIOUS_STATES = ('State1',)
+
 
-def validate_state1_output(event: Dict[str, Any]) -> bool:
+@validate_while_warming
+def validate_state1_output(event: dict) -> bool:
     """
     State1からの出力データの検証
     
@@ -23,21 +58,28 @@ def validate_state1_output(event: Dict[str, Any]) -> bool:
     Returns:
         bool: 検証結果
     """
-    required_fields = ['requestId', 'state1Output', 'stateMetadata']
-    
-    for field in required_fields:
-        if field not in event:
-            logger.error(f"Required field '{field}' is missing from State1 output")
+    if _schema_errors is not None:
+        error = _schema_errors(event)
+        if error:
+            logger.error("State1 output validation error: %s", error)
             return False
+        return True
+    
+    missing = _STATE2_REQUIRED - event.keys()
+    if missing:
+        logger.error("Required fields %s are missing from State1 output", sorted(missing))
+        return False
     
     # State1出力の詳細検証
     state1_output = event['state1Output']
-    required_state1_fields = ['processedValue', 'originalInput']
+    if not isinstance(state1_output, dict):
+        logger.error("state1Output must be a dictionary")
+        return False
     
-    for field in required_state1_fields:
-        if field not in state1_output:
-            logger.error(f"Required field '{field}' is missing from state1Output")
-            return False
+    missing = _STATE1_OUTPUT_REQUIRED - state1_output.keys()
+    if missing:
+        logger.error("Required fields %s are missing from state1Output", sorted(missing))
+        return False
     
     # メタデータの検証
     if event['stateMetadata'].get('state') != 'State1':
@@ -47,34 +89,63 @@ def validate_state1_output(event: Dict[str, Any]) -> bool:
     return True
 
 
-def process_state1_data(state1_output: Dict[str, Any]) -> Dict[str, Any]:
+def slim_state1_output(state1_output: dict) -> dict:
+    """
+    後続ステートが参照するフィールドのみを持つState1出力を生成
+    
+    Args:
+        state1_output: State1からの出力データ
+        
+    Returns:
+        dict: processedValue・originalInput・処理時刻のみを含むState1出力
+    """
+    return {
+        'processedValue': state1_output['processedValue'],
+        'originalInput': state1_output['originalInput'],
+        'processingDetails': {
+            'processingTime': state1_output.get('processingDetails', {}).get('processingTime')
+        }
+    }
+
+
+def process_state1_data(state1_output: dict, now_iso: str,
+                        previous_state_data: dict | None = None) -> dict:
     """
     State1からのデータを処理
     
     Args:
         state1_output: State1からの出力データ
+        now_iso: 呼び出し単位でキャッシュした現在時刻（ISO形式）
+        previous_state_data: previousStateDataとして引き継ぐデータ（省略時はstate1_output）
         
     Returns:
-        Dict: 処理済みデータ
+        dict: 処理済みデータ
     """
     # State1のデータを基に中間処理を実行
-    processed_value = f"State2_enhanced_{state1_output['processedValue']}"
+    previous_value = state1_output['processedValue']
+    # 文字列の場合は単純な連結で済ませ、それ以外のみフォーマットする
+    if isinstance(previous_value, str):
+        processed_value = "State2_enhanced_" + previous_value
+    else:
+        processed_value = f"State2_enhanced_{previous_value}"
     
     # 追加の処理ロジック
     enhancement_data = {
         'enhancementType': 'data_enrichment',
-        'additionalInfo': f"enriched_at_{datetime.now().strftime('%H%M%S')}",
-        'processingChain': ['State1', 'State2']
+        # ISO形式の時刻部分（HH:MM:SS）からHHMMSSを生成
+        'additionalInfo': f"enriched_at_{now_iso[11:19].replace(':', '')}",
+        'processingChain': _PROCESSING_CHAIN
     }
     
     return {
         'processedValue': processed_value,
-        'previousStateData': state1_output,
+        'previousStateData': state1_output if previous_state_data is None else previous_state_data,
         'enhancementData': enhancement_data,
         'processingDetails': {
             'transformationType': 'enhancement_and_enrichment',
-            'processingTime': datetime.now().isoformat(),
-            'dataSize': len(str(state1_output))
+            'processingTime': now_iso,
+            # JSONシリアライズ後のバイト数（str()による repr 生成は行わない）
+            'dataSize': dumped_size(state1_output)
         }
     }
 
@@ -88,29 +159,39 @@ def lambda_handler(event, context):
         context: Lambda実行コンテキスト
         
     Returns:
-        Dict: State3への出力データ
+        dict: State3への出力データ
     """
+    # 現在時刻は1回の呼び出しにつき1回だけ取得して使い回す
+    now_iso = datetime.now().isoformat()
+    
     try:
-        logger.info(f"State2 Lambda function started with event: {json.dumps(event)}")
+        logger.info("State2 Lambda function started with event: %s", LazyJSON(event))
         
         # State1出力の検証
         if not validate_state1_output(event):
             raise ValueError("State1 output validation failed")
         
+        # 後続へ引き継ぐState1データ（既定では必要なフィールドのみ）
+        state1_output = event['state1Output']
+        if _INCLUDE_FULL_STATE_HISTORY:
+            carried_state1 = state1_output
+        else:
+            carried_state1 = slim_state1_output(state1_output)
+        
         # State1データの処理
-        processed_data = process_state1_data(event['state1Output'])
+        processed_data = process_state1_data(state1_output, now_iso, carried_state1)
         
         # 前のステートデータを保持しながら新しい処理結果を追加
         output = {
             'requestId': event['requestId'],
-            'state1Output': event['state1Output'],  # 前のステートデータを保持
+            'state1Output': carried_state1,  # 前のステートデータを保持
             'state2Output': processed_data,
             'stateMetadata': {
                 'state': 'State2',
-                'executionTime': datetime.now().isoformat(),
+                'executionTime': now_iso,
                 'functionName': context.function_name if context else 'local_test',
                 'requestId': context.aws_request_id if context else 'test_request_id',
-                'previousStates': ['State1']
+                'previousStates': _PREVIOUS_STATES
             },
             'dataFlow': {
                 'inputSource': 'State1',
@@ -119,20 +200,26 @@ def lambda_handler(event, context):
             }
         }
         
-        logger.info(f"State2 processing completed successfully")
-        logger.info(f"Output data size: {len(json.dumps(output))} characters")
+        logger.info("State2 processing completed successfully")
+        if logger.isEnabledFor(logging.INFO):
+            output_size = dumped_size(output)
+            logger.info("Output data size: %d bytes", output_size)
+            if carried_state1 is not state1_output and logger.isEnabledFor(logging.DEBUG):
+                # State1出力を縮小したことによる削減量（2か所で引き継ぐため2倍）
+                saved = 2 * (dumped_size(state1_output) - dumped_size(carried_state1))
+                logger.debug("State history trimmed by %d bytes", saved)
         
         return output
         
     except Exception as e:
-        logger.error(f"Error in State2 Lambda function: {str(e)}")
+        logger.error("Error in State2 Lambda function: %s", e)
         
         # エラー情報を含む出力
         error_output = {
             'error': {
                 'type': 'State2ExecutionError',
                 'message': str(e),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': now_iso,
                 'input': event,
                 'previousState': 'State1'
             }
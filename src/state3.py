@@ -3,17 +3,48 @@ State3 Lambda Function
 State2からの出力を受け取り、最終処理を行うLambda関数
 """
 
+from __future__ import annotations
+
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, List
+
+try:
+    from json_utils import compile_schema, dumped_size, validate_while_warming
+except ImportError:  # pragma: no cover - fallback for package imports
+    from .json_utils import compile_schema, dumped_size, validate_while_warming
 
 # ログ設定
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
+# State2出力の必須フィールド
+_STATE3_REQUIRED = frozenset(('requestId', 'state1Output', 'state2Output', 'stateMetadata'))
+_STATE2_OUTPUT_REQUIRED = frozenset(('processedValue', 'previousStateData'))
+
+# State2出力のスキーマ（fastjsonschemaがあればインポート時に1回だけコンパイル）
+_STATE3_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'state1Output', 'state2Output', 'stateMetadata'],
+    'properties': {
+        'state2Output': {'type': 'object', 'required': ['processedValue', 'previousStateData']},
+        'stateMetadata': {
+            'type': 'object',
+            'required': ['state'],
+            'properties': {'state': {'const': 'State2'}}
+        }
+    }
+}
+_schema_errors = compile_schema(_STATE3_SCHEMA)
 
-def validate_state2_output(event: Dict[str, Any]) -> bool:
+# 出力に含める不変の定数（呼び出しごとにリストを生成しないようタプルで共有）
+_TOTAL_STATES = 3
+_COMPLETED_STATES = ('State1', 'State2', 'State3')
+_PREVIOUS_STATES = ('State1', 'State2')
+
+
+@validate_while_warming
+def validate_state2_output(event: dict) -> bool:
     """
     State2からの出力データの検証
     
@@ -23,21 +54,28 @@ def validate_state2_output(event: Dict[str, Any]) -> bool:
     Returns:
         bool: 検証結果
     """
-    required_fields = ['requestId', 'state1Output', 'state2Output', 'stateMetadata']
-    
-    for field in required_fields:
-        if field not in event:
-            logger.error(f"Required field '{field}' is missing from State2 output")
+    if _schema_errors is not None:
+        error = _schema_errors(event)
+        if error:
+            logger.error("State2 output validation error: %s", error)
             return False
+        return True
+    
+    missing = _STATE3_REQUIRED - event.keys()
+    if missing:
+        logger.error("Required fields %s are missing from State2 output", sorted(missing))
+        return False
     
     # State2出力の詳細検証
     state2_output = event['state2Output']
-    required_state2_fields = ['processedValue', 'previousStateData']
+    if not isinstance(state2_output, dict):
+        logger.error("state2Output must be a dictionary")
+        return False
     
-    for field in required_state2_fields:
-        if field not in state2_output:
-            logger.error(f"Required field '{field}' is missing from state2Output")
-            return False
+    missing = _STATE2_OUTPUT_REQUIRED - state2_output.keys()
+    if missing:
+        logger.error("Required fields %s are missing from state2Output", sorted(missing))
+        return False
     
     # メタデータの検証
     if event['stateMetadata'].get('state') != 'State2':
@@ -47,88 +85,79 @@ def validate_state2_output(event: Dict[str, Any]) -> bool:
     return True
 
 
-def aggregate_all_states_data(event: Dict[str, Any]) -> Dict[str, Any]:
+def aggregate_and_summarize(event: dict, processing_start_time: str,
+                            total_data_size: int | None = None) -> tuple[dict, dict]:
     """
-    全ステートのデータを集約
+    全ステートのデータ集約と実行サマリーの生成を1回の走査で行う
     
     Args:
         event: State2からの出力イベント
+        processing_start_time: 処理開始時刻
+        total_data_size: 計測済みの入力データサイズ（省略時はここで計測）
         
     Returns:
-        Dict: 集約されたデータ
+        tuple[dict, dict]: 集約されたデータと実行サマリー
     """
-    # 各ステートからのデータを抽出
+    # 各ステートからのデータを1回だけ抽出し、処理チェーンと処理時間の両方で共用
     state1_data = event['state1Output']
     state2_data = event['state2Output']
+    state1_details = state1_data.get('processingDetails')
+    state2_details = state2_data.get('processingDetails')
+    state1_time = state1_details.get('processingTime') if state1_details is not None else None
+    state2_time = state2_details.get('processingTime') if state2_details is not None else None
+    original_input = state1_data['originalInput']
+    previous_value = state2_data['processedValue']
     
     # 処理チェーンの構築
     processing_chain = [
         {
             'state': 'State1',
             'processedValue': state1_data['processedValue'],
-            'originalInput': state1_data['originalInput'],
-            'processingTime': state1_data.get('processingDetails', {}).get('processingTime')
+            'originalInput': original_input,
+            'processingTime': state1_time
         },
         {
             'state': 'State2', 
-            'processedValue': state2_data['processedValue'],
+            'processedValue': previous_value,
             'enhancementData': state2_data.get('enhancementData', {}),
-            'processingTime': state2_data.get('processingDetails', {}).get('processingTime')
+            'processingTime': state2_time
         }
     ]
     
     # 最終処理値の生成
-    final_processed_value = f"State3_final_{state2_data['processedValue']}"
+    # 文字列の場合は単純な連結で済ませ、それ以外のみフォーマットする
+    if isinstance(previous_value, str):
+        final_processed_value = "State3_final_" + previous_value
+    else:
+        final_processed_value = f"State3_final_{previous_value}"
     
-    return {
+    aggregated_data = {
         'finalProcessedValue': final_processed_value,
         'processingChain': processing_chain,
         'aggregatedMetadata': {
-            'totalStates': 3,
-            'originalInput': state1_data['originalInput'],
+            'totalStates': _TOTAL_STATES,
+            'originalInput': original_input,
             'finalTransformation': 'complete_workflow_processing'
         }
     }
-
-
-def generate_execution_summary(event: Dict[str, Any], processing_start_time: str) -> Dict[str, Any]:
-    """
-    実行サマリーの生成
-    
-    Args:
-        event: 入力イベント
-        processing_start_time: 処理開始時刻
-        
-    Returns:
-        Dict: 実行サマリー
-    """
-    processing_end_time = datetime.now().isoformat()
     
     # データサイズの計算
-    total_data_size = len(json.dumps(event))
-    
-    # 各ステートの処理時間を抽出（可能な場合）
-    state_timings = []
+    if total_data_size is None:
+        total_data_size = dumped_size(event)
     
-    if 'state1Output' in event and 'processingDetails' in event['state1Output']:
-        state_timings.append({
-            'state': 'State1',
-            'processingTime': event['state1Output']['processingDetails'].get('processingTime')
-        })
-    
-    if 'state2Output' in event and 'processingDetails' in event['state2Output']:
-        state_timings.append({
-            'state': 'State2', 
-            'processingTime': event['state2Output']['processingDetails'].get('processingTime')
-        })
-    
-    state_timings.append({
-        'state': 'State3',
-        'processingTime': processing_end_time
-    })
+    # 処理終了時刻は集約完了後に1回だけ取得
+    processing_end_time = datetime.now().isoformat()
     
-    return {
-        'totalStates': 3,
+    # 各ステートの処理時間（processingDetailsがある場合のみ）
+    state_timings = []
+    if state1_details is not None:
+        state_timings.append({'state': 'State1', 'processingTime': state1_time})
+    if state2_details is not None:
+        state_timings.append({'state': 'State2', 'processingTime': state2_time})
+    state_timings.append({'state': 'State3', 'processingTime': processing_end_time})
+    
+    execution_summary = {
+        'totalStates': _TOTAL_STATES,
         'executionStatus': 'SUCCESS',
         'processingStartTime': processing_start_time,
         'processingEndTime': processing_end_time,
@@ -136,6 +165,8 @@ def generate_execution_summary(event: Dict[str, Any], processing_start_time: str
         'stateTimings': state_timings,
         'dataFlowValidation': 'PASSED'
     }
+    
+    return aggregated_data, execution_summary
 
 
 def lambda_handler(event, context):
@@ -147,22 +178,24 @@ def lambda_handler(event, context):
         context: Lambda実行コンテキスト
         
     Returns:
-        Dict: 最終出力データ
+        dict: 最終出力データ
     """
     processing_start_time = datetime.now().isoformat()
     
     try:
-        logger.info(f"State3 Lambda function started with event data size: {len(json.dumps(event))} characters")
+        # 入力データサイズはログとサマリーで共用するため1回だけ計測
+        event_size = dumped_size(event)
+        logger.info("State3 Lambda function started with event data size: %d bytes", event_size)
         
         # State2出力の検証
         if not validate_state2_output(event):
             raise ValueError("State2 output validation failed")
         
-        # 全ステートのデータを集約
-        aggregated_data = aggregate_all_states_data(event)
-        
-        # 実行サマリーの生成
-        execution_summary = generate_execution_summary(event, processing_start_time)
+        # 全ステートのデータ集約と実行サマリーの生成（時刻取得は開始時と集約後の2回のみ）
+        aggregated_data, execution_summary = aggregate_and_summarize(
+            event, processing_start_time, event_size
+        )
+        processing_end_time = execution_summary['processingEndTime']
         
         # 最終出力の構築
         final_output = {
@@ -178,38 +211,38 @@ def lambda_handler(event, context):
                 'finalValue': aggregated_data['finalProcessedValue'],
                 'processingChain': aggregated_data['processingChain'],
                 'workflowMetadata': {
-                    'completedStates': ['State1', 'State2', 'State3'],
+                    'completedStates': _COMPLETED_STATES,
                     'totalProcessingTime': execution_summary['processingEndTime'],
                     'dataIntegrity': 'VERIFIED'
                 }
             },
             'stateMetadata': {
                 'state': 'State3',
-                'executionTime': datetime.now().isoformat(),
+                'executionTime': processing_end_time,
                 'functionName': context.function_name if context else 'local_test',
                 'requestId': context.aws_request_id if context else 'test_request_id',
-                'previousStates': ['State1', 'State2'],
+                'previousStates': _PREVIOUS_STATES,
                 'isWorkflowComplete': True
             }
         }
         
-        logger.info(f"State3 processing completed successfully")
-        logger.info(f"Final output generated with {len(final_output['allStatesData'])} state outputs")
-        logger.info(f"Workflow execution summary: {execution_summary['executionStatus']}")
+        logger.info("State3 processing completed successfully")
+        logger.info("Final output generated with %d state outputs", len(final_output['allStatesData']))
+        logger.info("Workflow execution summary: %s", execution_summary['executionStatus'])
         
         return final_output
         
     except Exception as e:
-        logger.error(f"Error in State3 Lambda function: {str(e)}")
+        logger.error("Error in State3 Lambda function: %s", e)
         
         # エラー情報を含む出力
         error_output = {
             'error': {
                 'type': 'State3ExecutionError',
                 'message': str(e),
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': processing_start_time,
                 'input': event,
-                'previousStates': ['State1', 'State2'],
+                'previousStates': _PREVIOUS_STATES,
                 'workflowStatus': 'FAILED'
             }
         }
@@ -14,7 +14,12 @@ try:
         WorkflowExecutionTester,
         create_sample_test_scenarios,
     )
-    from input_output_validator import InputOutputValidator, AssertionHelper
+    from input_output_validator import (
+        InputOutputValidator,
+        AssertionHelper,
+        P_STATE_NAME,
+        P_STATE1_PROCESSED,
+    )
     from test_runner import StepFunctionsTestRunner, load_config
 except ImportError:  # pragma: no cover - fallback for package imports
     from .stepfunctions_local_client import StepFunctionsLocalClient
@@ -22,7 +27,12 @@ except ImportError:  # pragma: no cover - fallback for package imports
         WorkflowExecutionTester,
         create_sample_test_scenarios,
     )
-    from .input_output_validator import InputOutputValidator, AssertionHelper
+    from .input_output_validator import (
+        InputOutputValidator,
+        AssertionHelper,
+        P_STATE_NAME,
+        P_STATE1_PROCESSED,
+    )
     from .test_runner import StepFunctionsTestRunner, load_config
 
 # ログ設定
@@ -128,7 +138,7 @@ def example_validation_usage():
     try:
         AssertionHelper.assert_field_equals(
             sample_state1_output, 
-            "stateMetadata.state", 
+            P_STATE_NAME, 
             "State1", 
             "State1メタデータ検証"
         )
@@ -136,7 +146,7 @@ def example_validation_usage():
         
         AssertionHelper.assert_field_contains(
             sample_state1_output,
-            "state1Output.processedValue",
+            P_STATE1_PROCESSED,
             "State1_processed_",
             "State1処理値検証"
         )
@@ -3,24 +3,431 @@
 各ステートの入出力データを検証するテスト関数と期待値との比較・アサーション機能
 """
 
-import json
 import logging
-from typing import Dict, Any, List, Optional, Union
-from datetime import datetime
-from dataclasses import dataclass
+import re
+from typing import Dict, Any, Callable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - fastjsonschema is optional
+    fastjsonschema = None
 
 # ログ設定
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
 
-@dataclass
-class ValidationResult:
-    """検証結果を格納するデータクラス"""
+# 各検証対象のJSONスキーマ
+# エラーとなる条件（必須フィールド・型・ステート名）のみを表現し、
+# 命名規則（processedValueのプレフィックス）は警告扱いのためスキーマには含めない
+_STATE_METADATA_SCHEMA = {
+    'type': 'object',
+    'required': ['state', 'executionTime']
+}
+
+_STATE1_OUTPUT_STRUCTURE_SCHEMA = {
+    'type': 'object',
+    'required': ['processedValue', 'originalInput'],
+    'properties': {
+        'processedValue': {'type': 'string'}
+    }
+}
+
+_WORKFLOW_INPUT_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'inputData'],
+    'properties': {
+        'requestId': {'type': 'string', 'pattern': r'\S'},
+        'inputData': {
+            'type': 'object',
+            'required': ['value'],
+            'properties': {
+                'metadata': {'type': 'object'}
+            }
+        }
+    }
+}
+
+_STATE1_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'state1Output', 'stateMetadata'],
+    'properties': {
+        'state1Output': _STATE1_OUTPUT_STRUCTURE_SCHEMA,
+        'stateMetadata': dict(_STATE_METADATA_SCHEMA, properties={'state': {'const': 'State1'}})
+    }
+}
+
+_STATE2_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'state1Output', 'state2Output', 'stateMetadata', 'dataFlow'],
+    'properties': {
+        'state1Output': _STATE1_OUTPUT_STRUCTURE_SCHEMA,
+        'state2Output': {
+            'type': 'object',
+            'required': ['processedValue', 'previousStateData', 'enhancementData'],
+            'properties': {
+                'processedValue': {'type': 'string'}
+            }
+        },
+        'stateMetadata': dict(_STATE_METADATA_SCHEMA, properties={'state': {'const': 'State2'}}),
+        'dataFlow': {
+            'type': 'object',
+            'required': ['inputSource', 'outputDestination', 'dataTransformation']
+        }
+    }
+}
+
+_STATE3_SCHEMA = {
+    'type': 'object',
+    'required': ['requestId', 'executionSummary', 'allStatesData', 'finalResult', 'stateMetadata'],
+    'properties': {
+        'executionSummary': {
+            'type': 'object',
+            'required': ['totalStates', 'executionStatus'],
+            'properties': {
+                'totalStates': {'const': 3}
+            }
+        },
+        'allStatesData': {
+            'type': 'object',
+            'required': ['state1Output', 'state2Output', 'state3Output']
+        },
+        'finalResult': {
+            'type': 'object',
+            'required': ['success', 'finalValue', 'processingChain'],
+            'properties': {
+                'success': {'type': 'boolean'}
+            }
+        },
+        'stateMetadata': dict(_STATE_METADATA_SCHEMA, properties={'state': {'const': 'State3'}})
+    }
+}
+
+_SCHEMAS = {
+    'workflow_input': _WORKFLOW_INPUT_SCHEMA,
+    'state1': _STATE1_SCHEMA,
+    'state2': _STATE2_SCHEMA,
+    'state3': _STATE3_SCHEMA
+}
+
+# スキーマはモジュール読み込み時に1回だけコンパイルし、全インスタンスで共有する
+if fastjsonschema is not None:
+    _COMPILED = {name: fastjsonschema.compile(schema) for name, schema in _SCHEMAS.items()}
+else:
+    _COMPILED = {}
+
+
+# dict.getのデフォルト値として共有する読み取り専用の空マッピング（呼び出しごとの空辞書生成を避ける）
+_EMPTY = MappingProxyType({})
+
+# 各ステートが付与するプレフィックスと残り（元の値側）を1回の照合で取り出す正規表現
+_PREFIX_RE = re.compile(r'(State1_processed_|State2_enhanced_|State3_final_)(.*)', re.DOTALL)
+
+# 各ステートの出力値に外側から順に付与されているはずのプレフィックス
+_STATE1_CHAIN = ('State1_processed_',)
+_STATE2_CHAIN = ('State2_enhanced_', 'State1_processed_')
+_STATE3_CHAIN = ('State3_final_', 'State2_enhanced_', 'State1_processed_')
+
+
+def _matches_transformation_chain(value: Any, prefixes: tuple, original_text: str) -> bool:
+    """
+    値が元の値に指定のプレフィックスを順に付与したものか確認
+    
+    Args:
+        value: 確認対象の値
+        prefixes: 外側から順に期待するプレフィックス
+        original_text: 元の値の文字列表現
+        
+    Returns:
+        bool: 期待どおりの変換結果であればTrue
+    """
+    if not isinstance(value, str):
+        return False
+    for prefix in prefixes:
+        match = _PREFIX_RE.match(value)
+        if match is None or match.group(1) != prefix:
+            return False
+        value = match.group(2)
+    return value == original_text
+
+
+@lru_cache(maxsize=None)
+def _get_validator(name: str):
+    """コンパイル済みの検証関数を取得（fastjsonschemaが利用できない場合はNone）"""
+    return _COMPILED.get(name)
+
+
+# 'equals'の期待値として、親ノードから渡された引数を使うことを表す番兵
+_ARG = object()
+
+# 詳細検証（スキーマ不適合時・fastjsonschema未導入時）で使用する各ノードの検証仕様
+# 各要素は検証操作で、記載順にエラー・警告が追加される（'required'は常に先頭で確認）:
+#   ('required', field, message)              : フィールド必須
+#   ('non_empty_str', field, message)         : 空でない文字列
+#   ('dict_child', field, message, check)     : 辞書でなければエラー、辞書なら子ノードを検証
+#   ('str_prefix', field, message, prefix, warning) : 文字列でなければエラー、プレフィックス不一致は警告
+#   ('is_type', field, type, message)         : 指定した型（フィールドが存在する場合のみ）
+#   ('equals', field, expected, template)     : 値の一致（expectedが_ARGの場合は親ノードからの引数と比較）
+#                                               templateは{expected}・{actual}を埋め込むstr.format形式
+#   ('child', field, check, arg)              : 子ノードを検証（argは子ノードの検証に渡す値）
+#   ('collapse', check, message)              : 他の検証を実行し、エラーがあれば1件にまとめる
+_NODE_SPECS = {
+    'workflow_input': (
+        ('required', 'requestId', "Required field 'requestId' is missing"),
+        ('required', 'inputData', "Required field 'inputData' is missing"),
+        ('non_empty_str', 'requestId', "requestId must be a non-empty string"),
+        ('dict_child', 'inputData', "inputData must be a dictionary", 'input_data'),
+    ),
+    'input_data': (
+        ('required', 'value', "inputData must contain 'value' field"),
+        ('is_type', 'metadata', dict, "metadata must be a dictionary"),
+    ),
+    'state1': (
+        ('required', 'requestId', "Required field 'requestId' is missing from State1 output"),
+        ('required', 'state1Output', "Required field 'state1Output' is missing from State1 output"),
+        ('required', 'stateMetadata', "Required field 'stateMetadata' is missing from State1 output"),
+        ('child', 'state1Output', 'state1_structure', None),
+        ('child', 'stateMetadata', 'state_metadata', 'State1'),
+    ),
+    'state1_structure': (
+        ('required', 'processedValue', "State1 output missing required field: processedValue"),
+        ('required', 'originalInput', "State1 output missing required field: originalInput"),
+        ('str_prefix', 'processedValue', "processedValue must be a string",
+         'State1_processed_', "processedValue does not follow expected naming pattern"),
+    ),
+    'state1_preserved': (
+        ('collapse', 'state1_structure', "State1 output data is not properly preserved in State2 output"),
+    ),
+    'state2': (
+        ('required', 'requestId', "Required field 'requestId' is missing from State2 output"),
+        ('required', 'state1Output', "Required field 'state1Output' is missing from State2 output"),
+        ('required', 'state2Output', "Required field 'state2Output' is missing from State2 output"),
+        ('required', 'stateMetadata', "Required field 'stateMetadata' is missing from State2 output"),
+        ('required', 'dataFlow', "Required field 'dataFlow' is missing from State2 output"),
+        ('child', 'state1Output', 'state1_preserved', None),
+        ('child', 'state2Output', 'state2_structure', None),
+        ('child', 'stateMetadata', 'state_metadata', 'State2'),
+        ('child', 'dataFlow', 'dataflow', None),
+    ),
+    'state2_structure': (
+        ('required', 'processedValue', "State2 output missing required field: processedValue"),
+        ('required', 'previousStateData', "State2 output missing required field: previousStateData"),
+        ('required', 'enhancementData', "State2 output missing required field: enhancementData"),
+        ('str_prefix', 'processedValue', "processedValue must be a string",
+         'State2_enhanced_', "processedValue does not follow expected naming pattern"),
+    ),
+    'state3': (
+        ('required', 'requestId', "Required field 'requestId' is missing from State3 output"),
+        ('required', 'executionSummary', "Required field 'executionSummary' is missing from State3 output"),
+        ('required', 'allStatesData', "Required field 'allStatesData' is missing from State3 output"),
+        ('required', 'finalResult', "Required field 'finalResult' is missing from State3 output"),
+        ('required', 'stateMetadata', "Required field 'stateMetadata' is missing from State3 output"),
+        ('child', 'executionSummary', 'execution_summary', None),
+        ('child', 'allStatesData', 'all_states_data', None),
+        ('child', 'finalResult', 'final_result', None),
+        ('child', 'stateMetadata', 'state_metadata', 'State3'),
+    ),
+    'state_metadata': (
+        ('required', 'state', "State metadata missing required field: state"),
+        ('required', 'executionTime', "State metadata missing required field: executionTime"),
+        ('equals', 'state', _ARG, "Expected state '{expected}', got '{actual}'"),
+    ),
+    'dataflow': (
+        ('required', 'inputSource', "DataFlow missing required field: inputSource"),
+        ('required', 'outputDestination', "DataFlow missing required field: outputDestination"),
+        ('required', 'dataTransformation', "DataFlow missing required field: dataTransformation"),
+    ),
+    'execution_summary': (
+        ('required', 'totalStates', "Execution summary missing required field: totalStates"),
+        ('required', 'executionStatus', "Execution summary missing required field: executionStatus"),
+        ('equals', 'totalStates', 3, "Expected 3 total states, got {actual}"),
+    ),
+    'all_states_data': (
+        ('required', 'state1Output', "All states data missing: state1Output"),
+        ('required', 'state2Output', "All states data missing: state2Output"),
+        ('required', 'state3Output', "All states data missing: state3Output"),
+    ),
+    'final_result': (
+        ('required', 'success', "Final result missing required field: success"),
+        ('required', 'finalValue', "Final result missing required field: finalValue"),
+        ('required', 'processingChain', "Final result missing required field: processingChain"),
+        ('is_type', 'success', bool, "success field must be boolean"),
+    ),
+}
+
+
+# 検証操作ごとの処理を生成する関数
+# 生成される処理のシグネチャは (d, arg, errors, warnings, children) で、
+# エラー・警告を引数のリストに追加し、子ノードの検証項目を children に追加する
+
+def _op_non_empty_str(field: str, message: str) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        if field in d:
+            x = d[field]
+            if not isinstance(x, str) or not x.strip():
+                errors.append(message)
+    return step
+
+
+def _op_dict_child(field: str, message: str, check: str) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        if field in d:
+            x = d[field]
+            if not isinstance(x, dict):
+                errors.append(message)
+            else:
+                children.append((check, x, None))
+    return step
+
+
+def _op_str_prefix(field: str, message: str, prefix: str, warning: str) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        if field in d:
+            x = d[field]
+            if not isinstance(x, str):
+                errors.append(message)
+            elif not x.startswith(prefix):
+                warnings.append(warning)
+    return step
+
+
+def _op_is_type(field: str, expected_type: type, message: str) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        if field in d and not isinstance(d[field], expected_type):
+            errors.append(message)
+    return step
+
+
+def _op_equals(field: str, expected: Any, template: str) -> Callable:
+    use_arg = expected is _ARG
+    
+    def step(d, arg, errors, warnings, children):
+        if field in d:
+            x = d[field]
+            value = arg if use_arg else expected
+            if x != value:
+                errors.append(template.format(expected=value, actual=x))
+    return step
+
+
+def _op_child(field: str, check: str, child_arg: Any) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        if field in d:
+            children.append((check, d[field], child_arg))
+    return step
+
+
+def _op_collapse(check: str, message: str) -> Callable:
+    def step(d, arg, errors, warnings, children):
+        nested_errors = []
+        _NODE_CHECKS[check](d, None, nested_errors, [])
+        if nested_errors:
+            errors.append(message)
+    return step
+
+
+_OP_BUILDERS: Dict[str, Callable[..., Callable]] = {
+    'non_empty_str': _op_non_empty_str,
+    'dict_child': _op_dict_child,
+    'str_prefix': _op_str_prefix,
+    'is_type': _op_is_type,
+    'equals': _op_equals,
+    'child': _op_child,
+    'collapse': _op_collapse,
+}
+
+
+def _build_validator(name: str, ops) -> Callable:
+    """
+    検証仕様から表駆動の検証関数を組み立てる
+    
+    組み立てた関数のシグネチャは (d, arg, errors, warnings) で、エラー・警告を
+    引数のリストに追加し、子ノードの検証項目 (検証名, データ, 引数) のリストを返す。
+    
+    Args:
+        name: 検証名
+        ops: 検証操作のタプル（_NODE_SPECSを参照）
+        
+    Returns:
+        Callable: 検証関数
+        
+    Raises:
+        ValueError: 未知の検証操作が含まれる場合
+    """
+    required_ops = tuple((op[1], op[2]) for op in ops if op[0] == 'required')
+    required = frozenset(field for field, _ in required_ops)
+    steps = []
+    for op in ops:
+        kind = op[0]
+        if kind == 'required':
+            continue
+        builder = _OP_BUILDERS.get(kind)
+        if builder is None:
+            raise ValueError(f"Unknown validation op '{kind}' in {name}")
+        steps.append(builder(*op[1:]))
+    steps = tuple(steps)
+    
+    def check(d, arg, errors, warnings):
+        # 必須フィールドは辞書の場合まずfrozensetとの集合比較で一括確認し、
+        # 欠落がある場合のみ仕様の記載順に個別のエラーを追加する
+        if required_ops and (type(d) is not dict or not d.keys() >= required):
+            for field, message in required_ops:
+                if field not in d:
+                    errors.append(message)
+        children = []
+        for step in steps:
+            step(d, arg, errors, warnings, children)
+        return children
+    
+    check.__name__ = f"_v_{name}"
+    return check
+
+
+# 各ノードの必須フィールド（一括検証関数の生成で使用）
+_REQUIRED: Dict[str, frozenset] = {
+    name: frozenset(op[1] for op in ops if op[0] == 'required')
+    for name, ops in _NODE_SPECS.items()
+}
+
+# 検証名と検証関数の対応表（_validate_iterで使用）
+_NODE_CHECKS: Dict[str, Callable] = {
+    _name: _build_validator(_name, _ops) for _name, _ops in _NODE_SPECS.items()
+}
+
+
+# 検証種別ごとの設定
+# (スキーマ適合時の命名規則チェック (出力キー, 接頭辞) またはNone, ログ表示名, エラーログ表示名)
+# 検証種別はスキーマ名（_SCHEMAS）および詳細検証のルートノード名（_NODE_SPECS）と共通
+_VALIDATION_TABLE: Dict[str, Tuple[Optional[Tuple[str, str]], str, str]] = {
+    'workflow_input': (None, 'Workflow input', 'Validation errors'),
+    'state1': (('state1Output', 'State1_processed_'), 'State1 output', 'State1 validation errors'),
+    'state2': (('state2Output', 'State2_enhanced_'), 'State2 output', 'State2 validation errors'),
+    'state3': (None, 'State3 output', 'State3 validation errors'),
+}
+
+
+class ValidationResult(NamedTuple):
+    """
+    検証結果を格納する名前付きタプル
+    
+    各検証メソッドはエラー・警告のリストを1組だけ確保して内部の検証関数に渡し、
+    最後に1回だけ本クラスを生成する。InputOutputValidatorの結果ではエラー・警告を
+    タプルで保持する（無い場合は空タプル）
+    
+    validated_data は検証対象データへの参照（コピーではない）を保持する。
+    読み取り専用として扱い、変更が必要な場合は利用側でコピーすること
+    """
     is_valid: bool
-    errors: List[str]
-    warnings: List[str]
-    validated_data: Optional[Dict[str, Any]] = None
+    errors: Sequence[str]
+    warnings: Sequence[str]
+    validated_data: Optional[Mapping[str, Any]] = None
+
+
+# エラー・警告の無い検証結果（validated_dataを持たない成功結果で共有する）
+_OK = ValidationResult(True, (), ())
 
 
 class InputOutputValidator:
@@ -29,331 +436,146 @@ class InputOutputValidator:
     各ステートの入出力データの形式と内容を検証
     """
     
-    def __init__(self):
-        """バリデーターの初期化"""
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    # インスタンスごとに取得せず、クラスで1つのロガーを共有する
+    logger = logging.getLogger(f"{__name__}.InputOutputValidator")
     
-    def validate_workflow_input(self, input_data: Dict[str, Any]) -> ValidationResult:
+    def _passes_schema(self, name: str, data: Dict[str, Any]) -> bool:
         """
-        ワークフロー初期入力データの検証
+        コンパイル済みスキーマによる高速検証
         
         Args:
-            input_data: 検証対象の入力データ
+            name: スキーマ名
+            data: 検証対象データ
             
         Returns:
-            ValidationResult: 検証結果
+            bool: スキーマに適合する場合True（fastjsonschemaが利用できない場合は常にFalse）
         """
-        errors = []
-        warnings = []
+        validate = _get_validator(name)
+        if validate is None:
+            return False
+        try:
+            validate(data)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+    
+    def _validate_iter(self, root: str, data: Dict[str, Any],
+                       errors: List[str], warnings: List[str], fail_fast: bool = False) -> None:
+        """
+        ワークリストによる反復的な詳細検証
         
-        # 必須フィールドの検証
-        required_fields = ['requestId', 'inputData']
-        for field in required_fields:
-            if field not in input_data:
-                errors.append(f"Required field '{field}' is missing")
-        
-        # requestIdの検証
-        if 'requestId' in input_data:
-            if not isinstance(input_data['requestId'], str) or not input_data['requestId'].strip():
-                errors.append("requestId must be a non-empty string")
-        
-        # inputDataの検証
-        if 'inputData' in input_data:
-            if not isinstance(input_data['inputData'], dict):
-                errors.append("inputData must be a dictionary")
-            else:
-                input_data_validation = self._validate_input_data_structure(input_data['inputData'])
-                errors.extend(input_data_validation.errors)
-                warnings.extend(input_data_validation.warnings)
+        各ノードの検証関数（_NODE_SPECSから生成）は自ノードのフィールドを検証し、
+        子ノードの検証を (検証名, データ, 引数) としてワークリストに追加する。
         
-        is_valid = len(errors) == 0
+        Args:
+            root: ルートノードの検証名
+            data: 検証対象データ
+            errors: エラーの追加先
+            warnings: 警告の追加先
+            fail_fast: Trueの場合、エラーが発生したノードの検証後に残りの検証を打ち切る
+        """
+        checks = _NODE_CHECKS
+        worklist = deque(((root, data, None),))
+        
+        while worklist:
+            name, node, arg = worklist.popleft()
+            children = checks[name](node, arg, errors, warnings)
+            if fail_fast and errors:
+                return
+            if children:
+                worklist.extend(children)
+    
+    def _validate(self, data: Dict[str, Any], kind: str, fail_fast: bool = False) -> ValidationResult:
+        """
+        検証種別に応じた共通の検証処理
+        
+        スキーマに適合する場合は命名規則の警告のみ確認し、適合しない場合のみ
+        エラー内容を特定するため個別の検証を行う
         
-        self.logger.info(f"Workflow input validation: {'PASSED' if is_valid else 'FAILED'}")
+        Args:
+            data: 検証対象データ
+            kind: 検証種別（_VALIDATION_TABLEのキー）
+            fail_fast: Trueの場合、最初にエラーが見つかった時点で詳細検証を打ち切る
+            
+        Returns:
+            ValidationResult: 検証結果
+        """
+        naming_check, log_label, error_label = _VALIDATION_TABLE[kind]
+        # エラー・警告のリストは実際に追加が発生し得る場合のみ確保する
+        errors = warnings = ()
+        
+        if self._passes_schema(kind, data):
+            # スキーマ検証済みのため命名規則の警告のみ確認
+            if naming_check is not None:
+                output_key, prefix = naming_check
+                if not data[output_key]['processedValue'].startswith(prefix):
+                    warnings = ["processedValue does not follow expected naming pattern"]
+        else:
+            errors = []
+            warnings = []
+            self._validate_iter(kind, data, errors, warnings, fail_fast)
+        
+        # 結果は変更されないようタプルで返す
         if errors:
-            self.logger.error(f"Validation errors: {errors}")
+            self.logger.info("%s validation: %s", log_label, 'FAILED')
+            self.logger.error("%s: %s", error_label, errors)
+            return ValidationResult(False, tuple(errors), tuple(warnings), None)
         
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            validated_data=input_data if is_valid else None
-        )
+        self.logger.info("%s validation: %s", log_label, 'PASSED')
+        # 検証済みデータはコピーせず参照のまま返す
+        return ValidationResult(True, (), tuple(warnings), data)
+    
+    def validate_workflow_input(self, input_data: Dict[str, Any], fail_fast: bool = False) -> ValidationResult:
+        """
+        ワークフロー初期入力データの検証
+        
+        Args:
+            input_data: 検証対象の入力データ
+            fail_fast: Trueの場合、最初にエラーが見つかった時点で検証を打ち切る
+            
+        Returns:
+            ValidationResult: 検証結果
+        """
+        return self._validate(input_data, 'workflow_input', fail_fast)
     
-    def validate_state1_output(self, output_data: Dict[str, Any]) -> ValidationResult:
+    def validate_state1_output(self, output_data: Dict[str, Any], fail_fast: bool = False) -> ValidationResult:
         """
         State1出力データの検証
         
         Args:
             output_data: State1の出力データ
+            fail_fast: Trueの場合、最初にエラーが見つかった時点で検証を打ち切る
             
         Returns:
             ValidationResult: 検証結果
         """
-        errors = []
-        warnings = []
-        
-        # 必須フィールドの検証
-        required_fields = ['requestId', 'state1Output', 'stateMetadata']
-        for field in required_fields:
-            if field not in output_data:
-                errors.append(f"Required field '{field}' is missing from State1 output")
-        
-        # state1Outputの詳細検証
-        if 'state1Output' in output_data:
-            state1_validation = self._validate_state1_output_structure(output_data['state1Output'])
-            errors.extend(state1_validation.errors)
-            warnings.extend(state1_validation.warnings)
-        
-        # stateMetadataの検証
-        if 'stateMetadata' in output_data:
-            metadata_validation = self._validate_state_metadata(output_data['stateMetadata'], 'State1')
-            errors.extend(metadata_validation.errors)
-            warnings.extend(metadata_validation.warnings)
-        
-        is_valid = len(errors) == 0
-        
-        self.logger.info(f"State1 output validation: {'PASSED' if is_valid else 'FAILED'}")
-        if errors:
-            self.logger.error(f"State1 validation errors: {errors}")
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            validated_data=output_data if is_valid else None
-        )
+        return self._validate(output_data, 'state1', fail_fast)
     
-    def validate_state2_output(self, output_data: Dict[str, Any]) -> ValidationResult:
+    def validate_state2_output(self, output_data: Dict[str, Any], fail_fast: bool = False) -> ValidationResult:
         """
         State2出力データの検証
         
         Args:
             output_data: State2の出力データ
+            fail_fast: Trueの場合、最初にエラーが見つかった時点で検証を打ち切る
             
         Returns:
             ValidationResult: 検証結果
         """
-        errors = []
-        warnings = []
-        
-        # 必須フィールドの検証
-        required_fields = ['requestId', 'state1Output', 'state2Output', 'stateMetadata', 'dataFlow']
-        for field in required_fields:
-            if field not in output_data:
-                errors.append(f"Required field '{field}' is missing from State2 output")
-        
-        # state1Outputの保持確認
-        if 'state1Output' in output_data:
-            state1_validation = self._validate_state1_output_structure(output_data['state1Output'])
-            if not state1_validation.is_valid:
-                errors.append("State1 output data is not properly preserved in State2 output")
-        
-        # state2Outputの詳細検証
-        if 'state2Output' in output_data:
-            state2_validation = self._validate_state2_output_structure(output_data['state2Output'])
-            errors.extend(state2_validation.errors)
-            warnings.extend(state2_validation.warnings)
-        
-        # stateMetadataの検証
-        if 'stateMetadata' in output_data:
-            metadata_validation = self._validate_state_metadata(output_data['stateMetadata'], 'State2')
-            errors.extend(metadata_validation.errors)
-            warnings.extend(metadata_validation.warnings)
-        
-        # dataFlowの検証
-        if 'dataFlow' in output_data:
-            dataflow_validation = self._validate_dataflow_structure(output_data['dataFlow'])
-            errors.extend(dataflow_validation.errors)
-            warnings.extend(dataflow_validation.warnings)
-        
-        is_valid = len(errors) == 0
-        
-        self.logger.info(f"State2 output validation: {'PASSED' if is_valid else 'FAILED'}")
-        if errors:
-            self.logger.error(f"State2 validation errors: {errors}")
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            validated_data=output_data if is_valid else None
-        )
+        return self._validate(output_data, 'state2', fail_fast)
     
-    def validate_state3_output(self, output_data: Dict[str, Any]) -> ValidationResult:
+    def validate_state3_output(self, output_data: Dict[str, Any], fail_fast: bool = False) -> ValidationResult:
         """
         State3（最終）出力データの検証
         
         Args:
             output_data: State3の出力データ
+            fail_fast: Trueの場合、最初にエラーが見つかった時点で検証を打ち切る
             
         Returns:
             ValidationResult: 検証結果
         """
-        errors = []
-        warnings = []
-        
-        # 必須フィールドの検証
-        required_fields = ['requestId', 'executionSummary', 'allStatesData', 'finalResult', 'stateMetadata']
-        for field in required_fields:
-            if field not in output_data:
-                errors.append(f"Required field '{field}' is missing from State3 output")
-        
-        # executionSummaryの検証
-        if 'executionSummary' in output_data:
-            summary_validation = self._validate_execution_summary(output_data['executionSummary'])
-            errors.extend(summary_validation.errors)
-            warnings.extend(summary_validation.warnings)
-        
-        # allStatesDataの検証
-        if 'allStatesData' in output_data:
-            all_states_validation = self._validate_all_states_data(output_data['allStatesData'])
-            errors.extend(all_states_validation.errors)
-            warnings.extend(all_states_validation.warnings)
-        
-        # finalResultの検証
-        if 'finalResult' in output_data:
-            final_result_validation = self._validate_final_result(output_data['finalResult'])
-            errors.extend(final_result_validation.errors)
-            warnings.extend(final_result_validation.warnings)
-        
-        # stateMetadataの検証
-        if 'stateMetadata' in output_data:
-            metadata_validation = self._validate_state_metadata(output_data['stateMetadata'], 'State3')
-            errors.extend(metadata_validation.errors)
-            warnings.extend(metadata_validation.warnings)
-        
-        is_valid = len(errors) == 0
-        
-        self.logger.info(f"State3 output validation: {'PASSED' if is_valid else 'FAILED'}")
-        if errors:
-            self.logger.error(f"State3 validation errors: {errors}")
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings,
-            validated_data=output_data if is_valid else None
-        )
-    
-    def _validate_input_data_structure(self, input_data: Dict[str, Any]) -> ValidationResult:
-        """inputDataの構造検証"""
-        errors = []
-        warnings = []
-        
-        if 'value' not in input_data:
-            errors.append("inputData must contain 'value' field")
-        
-        if 'metadata' in input_data and not isinstance(input_data['metadata'], dict):
-            errors.append("metadata must be a dictionary")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_state1_output_structure(self, state1_output: Dict[str, Any]) -> ValidationResult:
-        """State1出力構造の検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['processedValue', 'originalInput']
-        for field in required_fields:
-            if field not in state1_output:
-                errors.append(f"State1 output missing required field: {field}")
-        
-        # processedValueの検証
-        if 'processedValue' in state1_output:
-            if not isinstance(state1_output['processedValue'], str):
-                errors.append("processedValue must be a string")
-            elif not state1_output['processedValue'].startswith('State1_processed_'):
-                warnings.append("processedValue does not follow expected naming pattern")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_state2_output_structure(self, state2_output: Dict[str, Any]) -> ValidationResult:
-        """State2出力構造の検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['processedValue', 'previousStateData', 'enhancementData']
-        for field in required_fields:
-            if field not in state2_output:
-                errors.append(f"State2 output missing required field: {field}")
-        
-        # processedValueの検証
-        if 'processedValue' in state2_output:
-            if not isinstance(state2_output['processedValue'], str):
-                errors.append("processedValue must be a string")
-            elif not state2_output['processedValue'].startswith('State2_enhanced_'):
-                warnings.append("processedValue does not follow expected naming pattern")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_state_metadata(self, metadata: Dict[str, Any], expected_state: str) -> ValidationResult:
-        """ステートメタデータの検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['state', 'executionTime']
-        for field in required_fields:
-            if field not in metadata:
-                errors.append(f"State metadata missing required field: {field}")
-        
-        if 'state' in metadata and metadata['state'] != expected_state:
-            errors.append(f"Expected state '{expected_state}', got '{metadata['state']}'")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_dataflow_structure(self, dataflow: Dict[str, Any]) -> ValidationResult:
-        """データフロー構造の検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['inputSource', 'outputDestination', 'dataTransformation']
-        for field in required_fields:
-            if field not in dataflow:
-                errors.append(f"DataFlow missing required field: {field}")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_execution_summary(self, summary: Dict[str, Any]) -> ValidationResult:
-        """実行サマリーの検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['totalStates', 'executionStatus']
-        for field in required_fields:
-            if field not in summary:
-                errors.append(f"Execution summary missing required field: {field}")
-        
-        if 'totalStates' in summary and summary['totalStates'] != 3:
-            errors.append(f"Expected 3 total states, got {summary['totalStates']}")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_all_states_data(self, all_states: Dict[str, Any]) -> ValidationResult:
-        """全ステートデータの検証"""
-        errors = []
-        warnings = []
-        
-        required_states = ['state1Output', 'state2Output', 'state3Output']
-        for state in required_states:
-            if state not in all_states:
-                errors.append(f"All states data missing: {state}")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
-    
-    def _validate_final_result(self, final_result: Dict[str, Any]) -> ValidationResult:
-        """最終結果の検証"""
-        errors = []
-        warnings = []
-        
-        required_fields = ['success', 'finalValue', 'processingChain']
-        for field in required_fields:
-            if field not in final_result:
-                errors.append(f"Final result missing required field: {field}")
-        
-        if 'success' in final_result and not isinstance(final_result['success'], bool):
-            errors.append("success field must be boolean")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
+        return self._validate(output_data, 'state3', fail_fast)
 
 
 class DataFlowValidator:
@@ -362,9 +584,8 @@ class DataFlowValidator:
     ステート間のデータフローと変換を検証
     """
     
-    def __init__(self):
-        """データフロー検証クラスの初期化"""
-        self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+    # インスタンスごとに取得せず、クラスで1つのロガーを共有する
+    logger = logging.getLogger(f"{__name__}.DataFlowValidator")
     
     def validate_data_flow_continuity(self, 
                                     workflow_input: Dict[str, Any],
@@ -385,42 +606,62 @@ class DataFlowValidator:
         """
         errors = []
         warnings = []
+        self._check_continuity(workflow_input, state1_output, state2_output, state3_output, errors, warnings)
+        
+        is_valid = len(errors) == 0
+        
+        self.logger.info("Data flow continuity validation: %s", 'PASSED' if is_valid else 'FAILED')
+        if errors:
+            self.logger.error("Data flow validation errors: %s", errors)
+        elif not warnings:
+            return _OK
+        
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=errors,
+            warnings=warnings
+        )
+    
+    def validate_batch(self, workflows: List[Tuple[Dict[str, Any], Dict[str, Any],
+                                                   Dict[str, Any], Dict[str, Any]]]) -> List[ValidationResult]:
+        """
+        複数ワークフローのデータフロー連続性をまとめて検証
         
+        Args:
+            workflows: (ワークフロー初期入力, State1出力, State2出力, State3出力) のリスト
+            
+        Returns:
+            List[ValidationResult]: ワークフローごとの検証結果（入力と同じ順序）
+        """
+        validate = self.validate_data_flow_continuity
+        return [validate(*workflow) for workflow in workflows]
+    
+    def _check_continuity(self,
+                          workflow_input: Dict[str, Any],
+                          state1_output: Dict[str, Any],
+                          state2_output: Dict[str, Any],
+                          state3_output: Dict[str, Any],
+                          errors: List[str],
+                          warnings: List[str]) -> None:
+        """データフロー連続性の確認（ログは出力せず、エラー・警告は引数のリストに追加）"""
         # requestIdの連続性確認
         request_id = workflow_input.get('requestId')
         if not self._check_request_id_continuity(request_id, [state1_output, state2_output, state3_output]):
             errors.append("requestId is not consistent across all states")
         
         # 元の入力データの保持確認
-        original_value = workflow_input.get('inputData', {}).get('value')
+        original_value = workflow_input.get('inputData', _EMPTY).get('value')
         if not self._check_original_data_preservation(original_value, state1_output, state2_output, state3_output):
             errors.append("Original input data is not properly preserved through the workflow")
         
         # データ変換の連続性確認
-        transformation_validation = self._validate_data_transformations(
-            workflow_input, state1_output, state2_output, state3_output
-        )
-        errors.extend(transformation_validation.errors)
-        warnings.extend(transformation_validation.warnings)
-        
-        is_valid = len(errors) == 0
-        
-        self.logger.info(f"Data flow continuity validation: {'PASSED' if is_valid else 'FAILED'}")
-        if errors:
-            self.logger.error(f"Data flow validation errors: {errors}")
-        
-        return ValidationResult(
-            is_valid=is_valid,
-            errors=errors,
-            warnings=warnings
+        self._validate_data_transformations(
+            workflow_input, state1_output, state2_output, state3_output, errors, warnings
         )
     
     def _check_request_id_continuity(self, original_request_id: str, state_outputs: List[Dict[str, Any]]) -> bool:
         """requestIDの連続性確認"""
-        for output in state_outputs:
-            if output.get('requestId') != original_request_id:
-                return False
-        return True
+        return all(output.get('requestId') == original_request_id for output in state_outputs)
     
     def _check_original_data_preservation(self, 
                                         original_value: str, 
@@ -428,53 +669,197 @@ class DataFlowValidator:
                                         state2_output: Dict[str, Any],
                                         state3_output: Dict[str, Any]) -> bool:
         """元データの保持確認"""
+        empty = _EMPTY
+        
         # State1での保持確認
-        if state1_output.get('state1Output', {}).get('originalInput') != original_value:
+        if state1_output.get('state1Output', empty).get('originalInput') != original_value:
             return False
         
         # State2での保持確認（State1データ経由）
-        state1_data_in_state2 = state2_output.get('state1Output', {})
-        if state1_data_in_state2.get('originalInput') != original_value:
+        if state2_output.get('state1Output', empty).get('originalInput') != original_value:
             return False
         
         # State3での保持確認（allStatesData経由）
-        all_states_data = state3_output.get('allStatesData', {})
-        state1_data_in_state3 = all_states_data.get('state1Output', {})
-        if state1_data_in_state3.get('originalInput') != original_value:
-            return False
-        
-        return True
+        state1_data_in_state3 = state3_output.get('allStatesData', empty).get('state1Output', empty)
+        return state1_data_in_state3.get('originalInput') == original_value
     
     def _validate_data_transformations(self, 
                                      workflow_input: Dict[str, Any],
                                      state1_output: Dict[str, Any],
                                      state2_output: Dict[str, Any],
-                                     state3_output: Dict[str, Any]) -> ValidationResult:
-        """データ変換の検証"""
-        errors = []
-        warnings = []
-        
-        original_value = workflow_input.get('inputData', {}).get('value', '')
-        
+                                     state3_output: Dict[str, Any],
+                                     errors: List[str],
+                                     warnings: List[str]) -> None:
+        """データ変換の検証（エラー・警告は引数のリストに追加）"""
+        original_value = workflow_input.get('inputData', _EMPTY).get('value', '')
+        original_text = original_value if isinstance(original_value, str) else f"{original_value}"
+        
+        state1_processed = state1_output.get('state1Output', _EMPTY).get('processedValue', '')
+        state2_processed = state2_output.get('state2Output', _EMPTY).get('processedValue', '')
+        final_value = state3_output.get('finalResult', _EMPTY).get('finalValue', '')
+        
+        # 期待値の文字列は不一致の場合（エラーメッセージ用）にのみ組み立てる
         # State1変換の確認
-        state1_processed = state1_output.get('state1Output', {}).get('processedValue', '')
-        expected_state1 = f"State1_processed_{original_value}"
-        if state1_processed != expected_state1:
+        if not _matches_transformation_chain(state1_processed, _STATE1_CHAIN, original_text):
+            expected_state1 = "State1_processed_" + original_text
             errors.append(f"State1 transformation incorrect. Expected: {expected_state1}, Got: {state1_processed}")
         
         # State2変換の確認
-        state2_processed = state2_output.get('state2Output', {}).get('processedValue', '')
-        expected_state2 = f"State2_enhanced_{expected_state1}"
-        if state2_processed != expected_state2:
+        if not _matches_transformation_chain(state2_processed, _STATE2_CHAIN, original_text):
+            expected_state2 = "State2_enhanced_State1_processed_" + original_text
             errors.append(f"State2 transformation incorrect. Expected: {expected_state2}, Got: {state2_processed}")
         
         # State3変換の確認
-        final_value = state3_output.get('finalResult', {}).get('finalValue', '')
-        expected_final = f"State3_final_{expected_state2}"
-        if final_value != expected_final:
+        if not _matches_transformation_chain(final_value, _STATE3_CHAIN, original_text):
+            expected_final = "State3_final_State2_enhanced_State1_processed_" + original_text
             errors.append(f"State3 transformation incorrect. Expected: {expected_final}, Got: {final_value}")
-        
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors, warnings=warnings)
+
+
+def _codegen_const(namespace: Dict[str, Any], value: Any) -> str:
+    """生成コードから参照する値を名前空間に登録し、その変数名を返す"""
+    const_name = f"_K{len(namespace)}"
+    namespace[const_name] = value
+    return const_name
+
+
+def _codegen_fused_node(name: str, var: str, arg: Any, lines: List[str], namespace: Dict[str, Any]) -> None:
+    """
+    検証仕様のエラー条件を、適合しない場合にFalseを返す直線的なコードとして展開する
+    
+    警告のみの条件（プレフィックスの不一致）は含めない。子ノードは同じ関数内に展開する。
+    生成するのは制御構造のみで、仕様中の値（型・期待値など）は名前空間の定数として参照する。
+    
+    Args:
+        name: 検証名
+        var: 検証対象を参照する変数名
+        arg: 検証関数に渡される引数
+        lines: 生成したコードの追加先
+        namespace: 生成コードから参照する定数の登録先
+    """
+    ops = _NODE_SPECS[name]
+    required = _REQUIRED[name]
+    if required:
+        required_name = _codegen_const(namespace, required)
+        lines.append(f"    if type({var}) is not dict or not {var}.keys() >= {required_name}: return False")
+    
+    for op in ops:
+        kind, field = op[0], op[1]
+        if kind == 'required':
+            continue
+        if kind == 'collapse':
+            _codegen_fused_node(field, var, None, lines, namespace)
+            continue
+        if kind != 'is_type' and field not in required:
+            raise ValueError(f"Field '{field}' of {name} must be required to be fused")
+        
+        child_var = f"v{len(lines)}"
+        if kind == 'non_empty_str':
+            lines += [f"    x = {var}[{field!r}]",
+                      "    if not isinstance(x, str) or not x.strip(): return False"]
+        elif kind == 'dict_child':
+            lines.append(f"    {child_var} = {var}[{field!r}]")
+            lines.append(f"    if not isinstance({child_var}, dict): return False")
+            _codegen_fused_node(op[3], child_var, None, lines, namespace)
+        elif kind == 'str_prefix':
+            lines.append(f"    if not isinstance({var}[{field!r}], str): return False")
+        elif kind == 'is_type':
+            type_name = _codegen_const(namespace, op[2])
+            lines.append(f"    if {field!r} in {var} and not isinstance({var}[{field!r}], {type_name}): return False")
+        elif kind == 'equals':
+            expected_name = _codegen_const(namespace, arg if op[2] is _ARG else op[2])
+            lines.append(f"    if {var}[{field!r}] != {expected_name}: return False")
+        elif kind == 'child':
+            lines.append(f"    {child_var} = {var}[{field!r}]")
+            _codegen_fused_node(op[2], child_var, op[3], lines, namespace)
+        else:
+            raise ValueError(f"Unknown validation op '{kind}' in {name}")
+
+
+def generate_fused_validator() -> Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any], Dict[str, Any]], List[str]]:
+    """
+    ワークフロー入力と全ステート出力をまとめて検証する関数を生成
+    
+    4つの検証（_NODE_SPECSのエラー条件）とデータフロー連続性の確認を1つの直線的な関数に
+    展開してコンパイルし、requestIdや元の値は1回だけ取り出して使い回す。全て適合する場合は
+    空のリストを返し、適合しない場合のみ個別の検証と同じ処理でエラー内容を特定する
+    （ログは出力しない。ステートごとの結果が必要な場合は個別の検証メソッドを使用する）。
+    
+    Returns:
+        Callable: (ワークフロー初期入力, State1出力, State2出力, State3出力) を受け取り、
+            エラーのリストを返す関数
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def _fused_check(w, s1, s2, s3):"]
+    for name, var in (('workflow_input', 'w'), ('state1', 's1'), ('state2', 's2'), ('state3', 's3')):
+        _codegen_fused_node(name, var, None, lines, namespace)
+    
+    # データフロー連続性（構造の検証により各フィールドの存在は確認済み）
+    lines += [
+        "    request_id = w['requestId']",
+        "    if s1['requestId'] != request_id or s2['requestId'] != request_id"
+        " or s3['requestId'] != request_id: return False",
+        "    original = w['inputData']['value']",
+        "    s1_out = s1['state1Output']",
+        "    if s1_out['originalInput'] != original or s2['state1Output']['originalInput'] != original: return False",
+        "    x = s3['allStatesData']['state1Output']",
+        "    if type(x) is not dict or x.get('originalInput') != original: return False",
+        "    text = original if isinstance(original, str) else f'{original}'",
+        "    expected = 'State1_processed_' + text",
+        "    if s1_out['processedValue'] != expected: return False",
+        "    expected = 'State2_enhanced_' + expected",
+        "    if s2['state2Output']['processedValue'] != expected: return False",
+        "    return s3['finalResult']['finalValue'] == 'State3_final_' + expected",
+    ]
+    exec(compile("\n".join(lines), "<validator:fused>", "exec"), namespace)
+    fused_check = namespace['_fused_check']
+    
+    input_validator = InputOutputValidator()
+    dataflow_validator = DataFlowValidator()
+    
+    def validate_all(workflow_input: Dict[str, Any],
+                     state1_output: Dict[str, Any],
+                     state2_output: Dict[str, Any],
+                     state3_output: Dict[str, Any]) -> List[str]:
+        if fused_check(workflow_input, state1_output, state2_output, state3_output):
+            return []
+        
+        # 適合しない場合は個別の検証と同じ処理でエラー内容を特定する
+        errors: List[str] = []
+        for kind, data in (('workflow_input', workflow_input), ('state1', state1_output),
+                           ('state2', state2_output), ('state3', state3_output)):
+            input_validator._validate_iter(kind, data, errors, [])
+        dataflow_validator._check_continuity(
+            workflow_input, state1_output, state2_output, state3_output, errors, []
+        )
+        return errors
+    
+    return validate_all
+
+
+# 正常系のエントリポイントとして使用する一括検証関数
+validate_all = generate_fused_validator()
+
+
+@lru_cache(maxsize=256)
+def _split_path(field_path: str) -> tuple:
+    """ドット区切りのフィールドパスを分割（同じパスの繰り返しアサーション用にキャッシュ）"""
+    return tuple(field_path.split('.'))
+
+
+def _path_text(field_path: Union[str, Tuple[str, ...]]) -> str:
+    """エラーメッセージ用にフィールドパスをドット区切りの文字列で返す"""
+    return field_path if isinstance(field_path, str) else '.'.join(field_path)
+
+
+# 値が存在しないことを表す番兵（Noneを値として持つフィールドと区別する）
+_MISSING = object()
+
+# よく使うフィールドパス（分割済みのタプルとして渡すと分割処理を省略できる）
+P_STATE_NAME = ('stateMetadata', 'state')
+P_STATE1_PROCESSED = ('state1Output', 'processedValue')
+P_STATE1_ORIGINAL = ('state1Output', 'originalInput')
+P_STATE2_PROCESSED = ('state2Output', 'processedValue')
+P_FINAL_VALUE = ('finalResult', 'finalValue')
 
 
 class AssertionHelper:
@@ -500,27 +885,56 @@ class AssertionHelper:
             raise AssertionError(error_msg)
     
     @staticmethod
-    def assert_field_equals(actual_data: Dict[str, Any], field_path: str, expected_value: Any, context: str = ""):
+    def assert_field_equals(actual_data: Dict[str, Any], field_path: Union[str, Tuple[str, ...]], expected_value: Any, context: str = ""):
         """
         指定されたフィールドの値が期待値と等しいことをアサート
         
         Args:
             actual_data: 実際のデータ
-            field_path: フィールドパス（例: "state1Output.processedValue"）
+            field_path: フィールドパス（例: "state1Output.processedValue" または P_STATE1_PROCESSED）
             expected_value: 期待値
             context: コンテキスト情報
             
         Raises:
             AssertionError: 値が期待値と異なる場合
         """
-        actual_value = AssertionHelper._get_nested_value(actual_data, field_path)
+        AssertionHelper.assert_fields_equal(actual_data, {field_path: expected_value}, context)
+    
+    @staticmethod
+    def assert_fields_equal(actual_data: Dict[str, Any], expected_fields: Dict[str, Any], context: str = ""):
+        """
+        複数フィールドの値がそれぞれ期待値と等しいことをまとめてアサート
+        
+        全フィールドを確認してから、不一致のあったフィールドをまとめて1つのエラーとして報告する
         
-        if actual_value != expected_value:
-            error_msg = f"Field '{field_path}' assertion failed{' for ' + context if context else ''}: expected {expected_value}, got {actual_value}"
+        Args:
+            actual_data: 実際のデータ
+            expected_fields: フィールドパスと期待値の辞書（例: {"stateMetadata.state": "State1"}）
+            context: コンテキスト情報
+            
+        Raises:
+            AssertionError: いずれかの値が期待値と異なる場合
+        """
+        get_value = AssertionHelper._get_nested_value
+        mismatches = None
+        
+        for field_path, expected_value in expected_fields.items():
+            actual_value = get_value(actual_data, field_path)
+            if actual_value != expected_value:
+                if mismatches is None:
+                    mismatches = []
+                mismatches.append((field_path, expected_value, actual_value))
+        
+        if mismatches:
+            suffix = ' for ' + context if context else ''
+            error_msg = "\n".join(
+                f"Field '{_path_text(field_path)}' assertion failed{suffix}: expected {expected_value}, got {actual_value}"
+                for field_path, expected_value, actual_value in mismatches
+            )
             raise AssertionError(error_msg)
     
     @staticmethod
-    def assert_field_contains(actual_data: Dict[str, Any], field_path: str, expected_substring: str, context: str = ""):
+    def assert_field_contains(actual_data: Dict[str, Any], field_path: Union[str, Tuple[str, ...]], expected_substring: str, context: str = ""):
         """
         指定されたフィールドの値が期待する部分文字列を含むことをアサート
         
@@ -536,28 +950,30 @@ class AssertionHelper:
         actual_value = str(AssertionHelper._get_nested_value(actual_data, field_path))
         
         if expected_substring not in actual_value:
-            error_msg = f"Field '{field_path}' does not contain '{expected_substring}'{' for ' + context if context else ''}: got '{actual_value}'"
+            error_msg = f"Field '{_path_text(field_path)}' does not contain '{expected_substring}'{' for ' + context if context else ''}: got '{actual_value}'"
             raise AssertionError(error_msg)
     
     @staticmethod
-    def _get_nested_value(data: Dict[str, Any], field_path: str) -> Any:
+    def _get_nested_value(data: Dict[str, Any], field_path: Union[str, Tuple[str, ...]]) -> Any:
         """
         ネストされたフィールドの値を取得
         
         Args:
             data: データ辞書
-            field_path: フィールドパス（ドット区切り）
+            field_path: フィールドパス（ドット区切りの文字列、または分割済みのキーのタプル）
             
         Returns:
-            Any: フィールドの値
+            Any: フィールドの値（存在しない場合はNone）
         """
-        keys = field_path.split('.')
         current = data
+        keys = field_path if type(field_path) is tuple else _split_path(field_path)
         
         for key in keys:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
+            # 通常の辞書はtype比較で判定し、サブクラスのみisinstanceで確認
+            if not (type(current) is dict or isinstance(current, dict)):
+                return None
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
                 return None
         
         return current
\ No newline at end of file
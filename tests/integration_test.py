@@ -3,57 +3,136 @@
 全コンポーネントを統合したエンドツーエンドテストとGitHub Actions環境での実行確認・デバッグ機能
 """
 
+import importlib
 import json
 import time
 import logging
+import logging.handlers
+import math
 import sys
 import os
-from typing import Dict, Any, List, Optional, Tuple
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import chain
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
-import traceback
+from dataclasses import dataclass
 
 try:
-    from stepfunctions_local_client import StepFunctionsLocalClient, WorkflowExecutionMonitor
-    from workflow_execution_test import (
-        WorkflowExecutionTester,
-        WorkflowDataFlowTracer,
-        create_sample_test_scenarios,
-    )
-    from input_output_validator import (
-        InputOutputValidator,
-        DataFlowValidator,
-        AssertionHelper,
-    )
-    from test_runner import StepFunctionsTestRunner, load_config
-except ImportError:  # pragma: no cover - fallback for package imports
-    from .stepfunctions_local_client import StepFunctionsLocalClient, WorkflowExecutionMonitor
-    from .workflow_execution_test import (
-        WorkflowExecutionTester,
-        WorkflowDataFlowTracer,
-        create_sample_test_scenarios,
-    )
-    from .input_output_validator import (
-        InputOutputValidator,
-        DataFlowValidator,
-        AssertionHelper,
-    )
-    from .test_runner import StepFunctionsTestRunner, load_config
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # pragma: no cover - requests is optional (SAM Local API check only)
+    requests = None
+
+if TYPE_CHECKING:  # pragma: no cover - 型注釈専用
+    from test_runner import StepFunctionsTestRunner
 
 # ログ設定
+# ファイル出力はメモリ上にバッファし、ERROR以上のログまたは512件ごとにまとめて書き込む
+_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_file_handler = logging.handlers.RotatingFileHandler(
+    'integration_test.log', maxBytes=10 * 1024 * 1024, backupCount=3
+)
+# basicConfigはMemoryHandlerにのみフォーマッタを設定するため、書き込み先にも設定する
+_file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    format=_LOG_FORMAT,
     handlers=[
         logging.StreamHandler(sys.stdout),
-        logging.FileHandler('integration_test.log')
+        logging.handlers.MemoryHandler(capacity=512, flushLevel=logging.ERROR, target=_file_handler)
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+# SAM Local APIの接続確認用セッション（実行間でコネクションを再利用する）
+# ローカルのエンドポイントのため、タイムアウトは (接続, 読み取り) ともに短く設定する
+_SAM_PROBE_TIMEOUT = (0.5, 1.0)
+if requests is not None:
+    _SESSION = requests.Session()
+    _SESSION.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    _SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=4))
+else:
+    _SESSION = None
+
+# 接続確認結果のキャッシュ {(エンドポイント, 確認名): (確認時刻, 結果)}
+# 成功した結果のみを保持し、有効期間内は外部サービスへの再確認を省略する
+_CONNECTIVITY_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_CONNECTIVITY_CACHE_TTL = 30.0
+
+
+def _cached_probe(key: Tuple[str, str], probe, use_cache: bool = True) -> Any:
+    """
+    接続確認をキャッシュ付きで実行
+    
+    Args:
+        key: キャッシュキー (エンドポイント, 確認名)
+        probe: 接続確認を行う関数（成功時に真となる値を返す）
+        use_cache: Falseの場合、キャッシュを使用せず必ず再確認する
+        
+    Returns:
+        Any: 接続確認の結果
+    """
+    if use_cache:
+        entry = _CONNECTIVITY_CACHE.get(key)
+        if entry is not None and time.monotonic() - entry[0] < _CONNECTIVITY_CACHE_TTL:
+            return entry[1]
+    
+    value = probe()
+    if value:
+        _CONNECTIVITY_CACHE[key] = (time.monotonic(), value)
+    return value
+
 
-@dataclass
+def _import_framework(module_name: str):
+    """
+    テストフレームワークのモジュールを使用時にインポート
+    
+    boto3等を読み込むモジュールは、実際に必要になるまでインポートしない
+    （設定エラー等で早期に終了する場合の起動コストを避ける）
+    
+    Args:
+        module_name: モジュール名（例: "test_runner"）
+        
+    Returns:
+        module: インポートしたモジュール
+    """
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:  # pragma: no cover - fallback for package imports
+        return importlib.import_module(f".{module_name}", __package__)
+
+
+@lru_cache(maxsize=None)
+def _is_tool_available(tool: str) -> bool:
+    """
+    コマンドラインツールの利用可否を確認
+    
+    テスト実行中にツールの有無は変わらないため、結果はプロセス内でキャッシュする
+    """
+    try:
+        result = subprocess.run([tool, '--version'], 
+                              capture_output=True, 
+                              text=True, 
+                              timeout=10)
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+# dataclassのslots引数はPython 3.10以降のみ対応（CIのPython 3.9では通常のdataclassとなる）
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class IntegrationTestEnvironment:
     """統合テスト環境の設定と状態"""
     stepfunctions_endpoint: str
@@ -71,7 +150,7 @@ class IntegrationTestEnvironment:
             }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class IntegrationTestResult:
     """統合テスト結果"""
     test_suite_name: str
@@ -122,6 +201,20 @@ class IntegrationTestOrchestrator:
         )
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
+        # シナリオ開始間隔の制御用（前回のシナリオ開始時刻）
+        self._scenario_start_lock = threading.Lock()
+        self._last_scenario_start = float('-inf')
+        
+        # 統合テスト実行開始時刻（各フェーズ・レポートで共通のタイムスタンプとして使用）
+        self._run_started_at: Optional[datetime] = None
+        self._run_started_iso: Optional[str] = None
+        
+    def _timestamp_iso(self) -> str:
+        """統合テスト実行中は開始時刻、それ以外は現在時刻のISO形式文字列を返す"""
+        if self._run_started_iso is not None:
+            return self._run_started_iso
+        return datetime.now().isoformat()
+    
     def run_complete_integration_test(self) -> IntegrationTestResult:
         """
         完全な統合テストの実行
@@ -129,7 +222,10 @@ class IntegrationTestOrchestrator:
         Returns:
             IntegrationTestResult: 統合テスト結果
         """
-        start_time = time.time()
+        # 経過時間は単調増加の高分解能クロック（ナノ秒の整数）で計測する
+        start_ns = time.perf_counter_ns()
+        self._run_started_at = datetime.now()
+        self._run_started_iso = self._run_started_at.isoformat()
         
         # 結果オブジェクトの初期化
         result = IntegrationTestResult(
@@ -146,79 +242,99 @@ class IntegrationTestOrchestrator:
             warnings=[]
         )
         
+        # 各フェーズは (開始ログ, 実行メソッド) の順に実行し、
+        # 実行メソッドがFalseを返した時点で以降のフェーズを打ち切る
+        phases = (
+            ("📋 Phase 1: Environment diagnostics and setup verification", self._run_environment_phase),
+            ("🔗 Phase 2: Service connectivity testing", self._run_connectivity_phase),
+            ("⚙️ Phase 3: Workflow execution testing", self._run_workflow_phase),
+            ("🔍 Phase 4: Data flow integrity verification", self._run_data_flow_phase),
+            ("🐙 Phase 5: GitHub Actions compatibility check", self._run_github_actions_phase),
+            ("📊 Phase 6: Performance analysis", self._run_performance_phase),
+        )
+        
         try:
             self.logger.info("🚀 Starting complete integration test suite...")
             
-            # 1. 環境診断とセットアップ検証
-            self.logger.info("📋 Phase 1: Environment diagnostics and setup verification")
-            env_diagnostics = self._perform_environment_diagnostics()
-            result.environment_diagnostics = env_diagnostics
-            
-            if not env_diagnostics.get('environment_ready', False):
-                result.errors.append("Environment is not ready for testing")
-                return result
-            
-            # 2. サービス接続性テスト
-            self.logger.info("🔗 Phase 2: Service connectivity testing")
-            connectivity_result = self._test_service_connectivity()
-            
-            if not connectivity_result['all_services_available']:
-                result.errors.extend(connectivity_result['errors'])
-                result.warnings.extend(connectivity_result['warnings'])
-                return result
-            
-            # 3. ワークフロー実行テスト
-            self.logger.info("⚙️ Phase 3: Workflow execution testing")
-            workflow_results = self._execute_workflow_test_scenarios()
-            
-            result.total_scenarios = len(workflow_results)
-            result.successful_scenarios = sum(1 for r in workflow_results if r.get('success', False))
-            result.failed_scenarios = result.total_scenarios - result.successful_scenarios
-            result.detailed_results = workflow_results
-            
-            # エラーと警告の集約
-            for wr in workflow_results:
-                result.errors.extend(wr.get('errors', []))
-                result.warnings.extend(wr.get('warnings', []))
-            
-            # 4. データフロー整合性検証
-            self.logger.info("🔍 Phase 4: Data flow integrity verification")
-            dataflow_verification = self._verify_data_flow_integrity(workflow_results)
-            
-            if not dataflow_verification['integrity_verified']:
-                result.errors.extend(dataflow_verification['errors'])
-                result.warnings.extend(dataflow_verification['warnings'])
-            
-            # 5. GitHub Actions互換性チェック
-            self.logger.info("🐙 Phase 5: GitHub Actions compatibility check")
-            github_compatibility = self._check_github_actions_compatibility()
-            result.github_actions_compatible = github_compatibility['compatible']
-            
-            if not github_compatibility['compatible']:
-                result.warnings.extend(github_compatibility['issues'])
-            
-            # 6. パフォーマンス分析
-            self.logger.info("📊 Phase 6: Performance analysis")
-            performance_analysis = self._analyze_performance_metrics(workflow_results)
-            result.environment_diagnostics['performance'] = performance_analysis
+            for message, run_phase in phases:
+                self.logger.info(message)
+                if not run_phase(result):
+                    break
             
         except Exception as e:
-            self.logger.error(f"Critical error during integration test: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Critical error during integration test: {str(e)}")
             result.errors.append(f"Critical integration test error: {str(e)}")
         
         finally:
-            result.execution_time_seconds = time.time() - start_time
+            result.execution_time_seconds = (time.perf_counter_ns() - start_ns) / 1e9
             
             # 最終結果のログ出力
             self._log_final_results(result)
         
         return result
     
+    def _run_environment_phase(self, result: IntegrationTestResult) -> bool:
+        """1. 環境診断とセットアップ検証"""
+        env_diagnostics = self._perform_environment_diagnostics()
+        result.environment_diagnostics = env_diagnostics
+        
+        if not env_diagnostics.get('environment_ready', False):
+            result.errors.append("Environment is not ready for testing")
+            return False
+        return True
+    
+    def _run_connectivity_phase(self, result: IntegrationTestResult) -> bool:
+        """2. サービス接続性テスト"""
+        connectivity_result = self._test_service_connectivity()
+        
+        if not connectivity_result['all_services_available']:
+            result.errors.extend(connectivity_result['errors'])
+            result.warnings.extend(connectivity_result['warnings'])
+            return False
+        return True
+    
+    def _run_workflow_phase(self, result: IntegrationTestResult) -> bool:
+        """3. ワークフロー実行テスト"""
+        workflow_results = self._execute_workflow_test_scenarios()
+        
+        result.total_scenarios = len(workflow_results)
+        result.successful_scenarios = sum(1 for r in workflow_results if r.get('success', False))
+        result.failed_scenarios = result.total_scenarios - result.successful_scenarios
+        result.detailed_results = workflow_results
+        
+        # エラーと警告の集約
+        result.errors.extend(chain.from_iterable(wr.get('errors', ()) for wr in workflow_results))
+        result.warnings.extend(chain.from_iterable(wr.get('warnings', ()) for wr in workflow_results))
+        return True
+    
+    def _run_data_flow_phase(self, result: IntegrationTestResult) -> bool:
+        """4. データフロー整合性検証"""
+        dataflow_verification = self._verify_data_flow_integrity(result.detailed_results)
+        
+        if not dataflow_verification['integrity_verified']:
+            result.errors.extend(dataflow_verification['errors'])
+            result.warnings.extend(dataflow_verification['warnings'])
+        return True
+    
+    def _run_github_actions_phase(self, result: IntegrationTestResult) -> bool:
+        """5. GitHub Actions互換性チェック"""
+        github_compatibility = self._check_github_actions_compatibility()
+        result.github_actions_compatible = github_compatibility['compatible']
+        
+        if not github_compatibility['compatible']:
+            result.warnings.extend(github_compatibility['issues'])
+        return True
+    
+    def _run_performance_phase(self, result: IntegrationTestResult) -> bool:
+        """6. パフォーマンス分析"""
+        performance_analysis = self._analyze_performance_metrics(result.detailed_results)
+        result.environment_diagnostics['performance'] = performance_analysis
+        return True
+    
     def _perform_environment_diagnostics(self) -> Dict[str, Any]:
         """環境診断の実行"""
         diagnostics = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._timestamp_iso(),
             'environment_ready': False,
             'system_info': {},
             'service_endpoints': {},
@@ -228,15 +344,16 @@ class IntegrationTestOrchestrator:
         
         try:
             # システム情報の収集
+            env = os.environ
             diagnostics['system_info'] = {
                 'python_version': sys.version,
                 'platform': sys.platform,
                 'working_directory': os.getcwd(),
                 'environment_variables': {
-                    'STEPFUNCTIONS_ENDPOINT': os.getenv('STEPFUNCTIONS_ENDPOINT'),
-                    'STATE_MACHINE_ARN': os.getenv('STATE_MACHINE_ARN'),
-                    'CI': os.getenv('CI', 'false'),
-                    'GITHUB_ACTIONS': os.getenv('GITHUB_ACTIONS', 'false')
+                    'STEPFUNCTIONS_ENDPOINT': env.get('STEPFUNCTIONS_ENDPOINT'),
+                    'STATE_MACHINE_ARN': env.get('STATE_MACHINE_ARN'),
+                    'CI': env.get('CI', 'false'),
+                    'GITHUB_ACTIONS': env.get('GITHUB_ACTIONS', 'false')
                 }
             }
             
@@ -270,8 +387,13 @@ class IntegrationTestOrchestrator:
         
         return diagnostics
     
-    def _test_service_connectivity(self) -> Dict[str, Any]:
-        """サービス接続性のテスト"""
+    def _test_service_connectivity(self, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        サービス接続性のテスト
+        
+        Args:
+            use_cache: Falseの場合、直近の成功結果を使わず全サービスを再確認する
+        """
         connectivity_result = {
             'all_services_available': False,
             'service_status': {},
@@ -280,13 +402,38 @@ class IntegrationTestOrchestrator:
         }
         
         try:
-            # Step Functions Local接続テスト
+            # 各サービスの接続確認は独立しているため並行して実行する
             self.logger.info("Testing Step Functions Local connectivity...")
+            stepfunctions_endpoint = self.environment.stepfunctions_endpoint
+            state_machine_arn = self.environment.state_machine_arn
+            StepFunctionsLocalClient = _import_framework('stepfunctions_local_client').StepFunctionsLocalClient
             client = StepFunctionsLocalClient(
-                local_endpoint=self.environment.stepfunctions_endpoint
+                local_endpoint=stepfunctions_endpoint
             )
             
-            stepfunctions_available = client.test_connection()
+            def probe_state_machine() -> bool:
+                # ステートマシンの存在確認（ダミー実行ARNではなく、ステートマシンの詳細取得で確認）
+                client.client.describe_state_machine(stateMachineArn=state_machine_arn)
+                return True
+            
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                stepfunctions_future = executor.submit(
+                    _cached_probe, (stepfunctions_endpoint, 'stepfunctions_local'),
+                    client.test_connection, use_cache
+                )
+                sam_future = executor.submit(
+                    _cached_probe, (self.environment.sam_api_endpoint, 'sam_local_api'),
+                    self._probe_sam_local_api, use_cache
+                )
+                state_machine_future = None
+                if state_machine_arn:
+                    state_machine_future = executor.submit(
+                        _cached_probe, (stepfunctions_endpoint, f"state_machine:{state_machine_arn}"),
+                        probe_state_machine, use_cache
+                    )
+            
+            # Step Functions Local接続テスト
+            stepfunctions_available = stepfunctions_future.result()
             connectivity_result['service_status']['stepfunctions_local'] = stepfunctions_available
             
             if not stepfunctions_available:
@@ -297,13 +444,7 @@ class IntegrationTestOrchestrator:
                 self.logger.info("✓ Step Functions Local connection successful")
             
             # SAM Local API接続テスト（オプション）
-            try:
-                import requests
-                sam_response = requests.get(f"{self.environment.sam_api_endpoint}/", timeout=5)
-                sam_available = sam_response.status_code in [200, 404]  # 404も正常（エンドポイントが存在しない場合）
-            except Exception:
-                sam_available = False
-            
+            sam_available = sam_future.result()
             connectivity_result['service_status']['sam_local_api'] = sam_available
             
             if not sam_available:
@@ -313,12 +454,10 @@ class IntegrationTestOrchestrator:
             else:
                 self.logger.info("✓ SAM Local API connection successful")
             
-            # ステートマシン存在確認
-            if stepfunctions_available and self.environment.state_machine_arn:
+            # ステートマシン存在確認（Step Functions Localに接続できた場合のみ結果を使用）
+            if stepfunctions_available and state_machine_future is not None:
                 try:
-                    # ステートマシンの存在確認（ダミー実行ARNではなく、ステートマシンの詳細取得で確認）
-                    client.client.describe_state_machine(stateMachineArn=self.environment.state_machine_arn)
-                    state_machine_available = True
+                    state_machine_available = state_machine_future.result()
                     self.logger.info("✓ State machine exists and is accessible")
                 except Exception as e:
                     # ステートマシンが存在しない場合は警告として扱う
@@ -338,69 +477,55 @@ class IntegrationTestOrchestrator:
         
         return connectivity_result
     
+    def _probe_sam_local_api(self) -> bool:
+        """SAM Local APIへの接続確認"""
+        if _SESSION is None:
+            return False
+        try:
+            sam_response = _SESSION.get(f"{self.environment.sam_api_endpoint}/", timeout=_SAM_PROBE_TIMEOUT)
+            return sam_response.status_code in [200, 404]  # 404も正常（エンドポイントが存在しない場合）
+        except Exception:
+            return False
+    
     def _execute_workflow_test_scenarios(self) -> List[Dict[str, Any]]:
         """ワークフローテストシナリオの実行"""
         workflow_results = []
         
         try:
-            # テストランナーの初期化
-            runner = StepFunctionsTestRunner(self.config)
-            
             # テストシナリオの取得
             test_scenarios = self.config.get('test_scenarios')
             if not test_scenarios:
                 self.logger.info("Using default test scenarios")
-                test_scenarios = create_sample_test_scenarios()
-            
-            self.logger.info(f"Executing {len(test_scenarios)} test scenarios...")
-            
-            # 各シナリオの実行
-            for i, scenario in enumerate(test_scenarios, 1):
-                scenario_name = scenario.get('name', f'scenario_{i}')
-                self.logger.info(f"Executing scenario {i}/{len(test_scenarios)}: {scenario_name}")
-                
-                scenario_result = {
-                    'scenario_name': scenario_name,
-                    'scenario_index': i,
-                    'success': False,
-                    'execution_time': 0.0,
-                    'errors': [],
-                    'warnings': [],
-                    'details': {}
+                test_scenarios = _import_framework('workflow_execution_test').create_sample_test_scenarios()
+            
+            StepFunctionsTestRunner = _import_framework('test_runner').StepFunctionsTestRunner
+            total = len(test_scenarios)
+            self.logger.info(f"Executing {total} test scenarios...")
+            
+            # 各シナリオは独立した実行のため並行して実行する
+            # テストランナーはセットアップ時に状態を持つため、ワーカースレッドごとに生成する
+            local = threading.local()
+            
+            def run_scenario(index: int, scenario: Dict[str, Any]) -> Dict[str, Any]:
+                runner = getattr(local, 'runner', None)
+                if runner is None:
+                    runner = local.runner = StepFunctionsTestRunner(self.config)
+                self._wait_for_scenario_slot()
+                return self._run_workflow_test_scenario(runner, index, total, scenario)
+            
+            max_workers = max(1, min(self.config.get('scenario_concurrency', 8), total or 1))
+            scenario_results = [None] * total
+            
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(run_scenario, i, scenario): i
+                    for i, scenario in enumerate(test_scenarios, 1)
                 }
-                
-                try:
-                    start_time = time.time()
-                    
-                    # 単一テストの実行
-                    test_result = runner.run_single_test(
-                        scenario_name, 
-                        scenario.get('input_data', {})
-                    )
-                    
-                    scenario_result['execution_time'] = time.time() - start_time
-                    scenario_result['details'] = test_result
-                    
-                    # 成功判定
-                    if test_result.get('status') == 'COMPLETED':
-                        test_data = test_result.get('test_result', {})
-                        scenario_result['success'] = test_data.get('success', False)
-                        
-                        if not scenario_result['success']:
-                            scenario_result['errors'].extend(test_data.get('errors', []))
-                            scenario_result['warnings'].extend(test_data.get('warnings', []))
-                    else:
-                        scenario_result['errors'].append(f"Test execution failed: {test_result.get('error', 'Unknown error')}")
-                
-                except Exception as e:
-                    scenario_result['errors'].append(f"Scenario execution error: {str(e)}")
-                    self.logger.error(f"Error in scenario {scenario_name}: {str(e)}")
-                
-                workflow_results.append(scenario_result)
-                
-                # シナリオ間の間隔
-                if i < len(test_scenarios):
-                    time.sleep(1)
+                for future in as_completed(futures):
+                    scenario_results[futures[future] - 1] = future.result()
+            
+            # 結果はシナリオの定義順で返す
+            workflow_results.extend(scenario_results)
             
         except Exception as e:
             self.logger.error(f"Workflow test scenarios execution error: {str(e)}")
@@ -414,6 +539,72 @@ class IntegrationTestOrchestrator:
         
         return workflow_results
     
+    def _wait_for_scenario_slot(self):
+        """
+        シナリオの開始間隔を最小間隔以上に保つ
+        
+        前回の開始から config['scenario_min_interval'] 秒（省略時0.05秒）経過していない場合のみ待機する
+        """
+        min_interval = self.config.get('scenario_min_interval', 0.05)
+        
+        # ロック内では次の開始時刻の予約のみ行い、待機はロック外で行う
+        with self._scenario_start_lock:
+            now = time.monotonic()
+            start = max(now, self._last_scenario_start + min_interval)
+            self._last_scenario_start = start
+        
+        delay = start - now
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _run_workflow_test_scenario(self,
+                                    runner: 'StepFunctionsTestRunner',
+                                    index: int,
+                                    total: int,
+                                    scenario: Dict[str, Any]) -> Dict[str, Any]:
+        """単一シナリオの実行と結果の組み立て"""
+        scenario_name = scenario.get('name', f'scenario_{index}')
+        self.logger.info(f"Executing scenario {index}/{total}: {scenario_name}")
+        
+        scenario_result = {
+            'scenario_name': scenario_name,
+            'scenario_index': index,
+            'success': False,
+            'execution_time': 0.0,
+            'errors': [],
+            'warnings': [],
+            'details': {}
+        }
+        
+        try:
+            start_ns = time.perf_counter_ns()
+            
+            # 単一テストの実行
+            test_result = runner.run_single_test(
+                scenario_name, 
+                scenario.get('input_data', {})
+            )
+            
+            scenario_result['execution_time'] = (time.perf_counter_ns() - start_ns) / 1e9
+            scenario_result['details'] = test_result
+            
+            # 成功判定
+            if test_result.get('status') == 'COMPLETED':
+                test_data = test_result.get('test_result', {})
+                scenario_result['success'] = test_data.get('success', False)
+                
+                if not scenario_result['success']:
+                    scenario_result['errors'].extend(test_data.get('errors', []))
+                    scenario_result['warnings'].extend(test_data.get('warnings', []))
+            else:
+                scenario_result['errors'].append(f"Test execution failed: {test_result.get('error', 'Unknown error')}")
+        
+        except Exception as e:
+            scenario_result['errors'].append(f"Scenario execution error: {str(e)}")
+            self.logger.error(f"Error in scenario {scenario_name}: {str(e)}")
+        
+        return scenario_result
+    
     def _verify_data_flow_integrity(self, workflow_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """データフロー整合性の検証"""
         verification_result = {
@@ -426,9 +617,17 @@ class IntegrationTestOrchestrator:
         }
         
         try:
-            dataflow_validator = DataFlowValidator()
             successful_results = [r for r in workflow_results if r.get('success', False)]
             
+            # 成功したシナリオが無い場合は検証対象が無いため、検証器を生成せずに終了する
+            if not successful_results:
+                verification_result['warnings'].append('No successful scenarios to verify')
+                return verification_result
+            
+            # シナリオ結果には最終出力のみが含まれるため、State3出力の構造を確認する
+            # （全ステートの一括検証はWorkflowExecutionTesterで実行済み）
+            validator = _import_framework('input_output_validator').InputOutputValidator()
+            
             for result in successful_results:
                 scenario_name = result.get('scenario_name', 'unknown')
                 
@@ -439,7 +638,6 @@ class IntegrationTestOrchestrator:
                     
                     if final_output:
                         # 基本的な出力構造の確認
-                        validator = InputOutputValidator()
                         validation_result = validator.validate_state3_output(final_output)
                         
                         if validation_result.is_valid:
@@ -477,25 +675,18 @@ class IntegrationTestOrchestrator:
         
         try:
             # CI環境の検出
-            ci_detected = os.getenv('CI', '').lower() == 'true'
-            github_actions_detected = os.getenv('GITHUB_ACTIONS', '').lower() == 'true'
+            env = os.environ
+            ci_detected = env.get('CI', '').lower() == 'true'
+            github_actions_detected = env.get('GITHUB_ACTIONS', '').lower() == 'true'
             
             compatibility_result['ci_environment_detected'] = ci_detected or github_actions_detected
             
             # 必要なツールの確認
             required_tools = ['python', 'java']
-            tools_status = {}
             
-            for tool in required_tools:
-                try:
-                    import subprocess
-                    result = subprocess.run([tool, '--version'], 
-                                          capture_output=True, 
-                                          text=True, 
-                                          timeout=10)
-                    tools_status[tool] = result.returncode == 0
-                except Exception:
-                    tools_status[tool] = False
+            # 各ツールのプロセス起動（特にJVM）は並行して実行する
+            with ThreadPoolExecutor(max_workers=len(required_tools)) as executor:
+                tools_status = dict(zip(required_tools, executor.map(_is_tool_available, required_tools)))
             
             compatibility_result['required_tools_available'] = tools_status
             
@@ -506,11 +697,7 @@ class IntegrationTestOrchestrator:
             
             # 環境変数の確認
             required_env_vars = ['STEPFUNCTIONS_ENDPOINT', 'STATE_MACHINE_ARN']
-            missing_env_vars = []
-            
-            for env_var in required_env_vars:
-                if not os.getenv(env_var):
-                    missing_env_vars.append(env_var)
+            missing_env_vars = [env_var for env_var in required_env_vars if not env.get(env_var)]
             
             if missing_env_vars:
                 compatibility_result['issues'].append(f"Missing environment variables: {missing_env_vars}")
@@ -537,35 +724,38 @@ class IntegrationTestOrchestrator:
         }
         
         try:
-            execution_times = []
-            scenario_times = {}
+            # 合計・最速・最遅を1回の走査で求める
+            total_time = 0.0
+            scenario_count = 0
+            fastest_time, fastest_name = math.inf, None
+            slowest_time, slowest_name = -math.inf, None
             
             for result in workflow_results:
-                scenario_name = result.get('scenario_name', 'unknown')
                 execution_time = result.get('execution_time', 0.0)
+                total_time += execution_time
+                scenario_count += 1
                 
-                execution_times.append(execution_time)
-                scenario_times[scenario_name] = execution_time
-            
-            if execution_times:
-                performance_analysis['total_execution_time'] = sum(execution_times)
-                performance_analysis['average_scenario_time'] = sum(execution_times) / len(execution_times)
-                
-                fastest_time = min(execution_times)
-                slowest_time = max(execution_times)
+                if execution_time < fastest_time:
+                    fastest_time, fastest_name = execution_time, result.get('scenario_name', 'unknown')
+                if execution_time > slowest_time:
+                    slowest_time, slowest_name = execution_time, result.get('scenario_name', 'unknown')
+            
+            if scenario_count:
+                performance_analysis['total_execution_time'] = total_time
+                performance_analysis['average_scenario_time'] = total_time / scenario_count
                 
                 performance_analysis['fastest_scenario'] = {
-                    'name': next(name for name, time in scenario_times.items() if time == fastest_time),
+                    'name': fastest_name,
                     'time': fastest_time
                 }
                 
                 performance_analysis['slowest_scenario'] = {
-                    'name': next(name for name, time in scenario_times.items() if time == slowest_time),
+                    'name': slowest_name,
                     'time': slowest_time
                 }
                 
                 performance_analysis['performance_summary'] = {
-                    'total_scenarios': len(execution_times),
+                    'total_scenarios': scenario_count,
                     'total_time_seconds': performance_analysis['total_execution_time'],
                     'average_time_seconds': performance_analysis['average_scenario_time'],
                     'time_range_seconds': slowest_time - fastest_time
@@ -605,10 +795,11 @@ class IntegrationTestOrchestrator:
     
     def generate_integration_report(self, result: IntegrationTestResult) -> Dict[str, Any]:
         """統合テストレポートの生成"""
+        environment = result.environment
         report = {
             'integration_test_report': {
                 'metadata': {
-                    'generated_at': datetime.now().isoformat(),
+                    'generated_at': self._timestamp_iso(),
                     'test_suite': result.test_suite_name,
                     'execution_time_seconds': result.execution_time_seconds,
                     'github_actions_compatible': result.github_actions_compatible
@@ -620,7 +811,14 @@ class IntegrationTestOrchestrator:
                     'success_rate_percent': result.success_rate,
                     'overall_success': result.overall_success
                 },
-                'environment': asdict(result.environment),
+                # asdictによる再帰的なコピーを避け、フィールドを直接参照する
+                'environment': {
+                    'stepfunctions_endpoint': environment.stepfunctions_endpoint,
+                    'sam_api_endpoint': environment.sam_api_endpoint,
+                    'state_machine_arn': environment.state_machine_arn,
+                    'environment_ready': environment.environment_ready,
+                    'services_status': environment.services_status
+                },
                 'diagnostics': result.environment_diagnostics,
                 'detailed_results': result.detailed_results,
                 'issues': {
@@ -645,14 +843,17 @@ def run_integration_test_from_config(config_file: Optional[str] = None) -> Integ
     """
     try:
         # 設定の読み込み
-        config = load_config(config_file)
+        config = _import_framework('test_runner').load_config(config_file)
         
         # 環境変数からの設定上書き
-        if os.getenv('STEPFUNCTIONS_ENDPOINT'):
-            config['stepfunctions_local_endpoint'] = os.getenv('STEPFUNCTIONS_ENDPOINT')
+        env = os.environ
+        stepfunctions_endpoint = env.get('STEPFUNCTIONS_ENDPOINT')
+        if stepfunctions_endpoint:
+            config['stepfunctions_local_endpoint'] = stepfunctions_endpoint
         
-        if os.getenv('STATE_MACHINE_ARN'):
-            config['state_machine_arn'] = os.getenv('STATE_MACHINE_ARN')
+        state_machine_arn = env.get('STATE_MACHINE_ARN')
+        if state_machine_arn:
+            config['state_machine_arn'] = state_machine_arn
         
         # 統合テストの実行
         orchestrator = IntegrationTestOrchestrator(config)
@@ -661,8 +862,7 @@ def run_integration_test_from_config(config_file: Optional[str] = None) -> Integ
         return result
         
     except Exception as e:
-        logger.error(f"Integration test execution failed: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"Integration test execution failed: {str(e)}")
         
         # エラー時のダミー結果
         return IntegrationTestResult(
@@ -709,8 +909,24 @@ def main():
         orchestrator = IntegrationTestOrchestrator({})
         report = orchestrator.generate_integration_report(result)
         
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+        # 一時ファイルに書き込んでから置き換え、書き込み途中のレポートが残らないようにする
+        tmp_output = args.output + '.tmp'
+        if orjson is not None:
+            # orjsonは非ASCII文字をそのままUTF-8で出力する（ensure_ascii=False相当）
+            with open(tmp_output, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str
+                ))
+                f.flush()
+                os.fsync(f.fileno())
+        else:
+            with open(tmp_output, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_output, args.output)
         
         logger.info(f"📊 Integration test report saved to {args.output}")
         
@@ -726,8 +942,7 @@ def main():
         logger.info("⏹️ Integration test interrupted by user")
         sys.exit(130)
     except Exception as e:
-        logger.error(f"💥 Unexpected error: {str(e)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(f"💥 Unexpected error: {str(e)}")
         sys.exit(1)
 
 
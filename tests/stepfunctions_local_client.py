@@ -5,16 +5,135 @@ Step Functions Localに接続するBoto3クライアントとワークフロー
 
 import boto3
 import json
+import math
 import time
 import logging
-from typing import Dict, Any, Optional, List
-from datetime import datetime
-from botocore.exceptions import ClientError, NoCredentialsError
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Dict, Any, Optional, List, Tuple, Union
+from datetime import datetime, timedelta
+from botocore.config import Config
+from botocore.exceptions import ClientError, NoCredentialsError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
 
 # ログ設定
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# ポーリングで同じエンドポイントを繰り返し呼ぶため、keep-aliveを有効にした
+# コネクションプールを使い、呼び出しごとのTCPハンドシェイクを避ける
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+# 接続先と認証情報ごとにboto3クライアントを共有し、
+# インスタンスを作り直してもコネクションプールを再利用する
+_CLIENT_CACHE: Dict[Tuple[str, str, str, str], Any] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+# クライアント生成用の専用セッション（サービスモデルの読み込みを1回で済ませ、
+# boto3のデフォルトセッションが差し替えられても影響を受けない）
+_SESSION: Optional[boto3.session.Session] = None
+
+# boto3にはDescribeExecution用のWaiterが無いため、終了ステータスを
+# 受理条件とするカスタムWaiterを定義してポーリングをbotocoreに任せる
+_EXECUTION_COMPLETE_WAITER = 'ExecutionComplete'
+_WAITER_MODEL = WaiterModel({
+    'version': 2,
+    'waiters': {
+        _EXECUTION_COMPLETE_WAITER: {
+            'operation': 'DescribeExecution',
+            'delay': 2,
+            'maxAttempts': 150,
+            'acceptors': [
+                {'state': 'success', 'matcher': 'path', 'argument': 'status', 'expected': status}
+                for status in ('SUCCEEDED', 'FAILED', 'TIMED_OUT', 'ABORTED')
+            ]
+        }
+    }
+})
+
+
+def _json_dumps(data: Any) -> str:
+    """
+    JSON文字列へのシリアライズ（orjsonが利用可能な場合はC実装を使用）
+    
+    Args:
+        data: シリアライズ対象データ
+        
+    Returns:
+        str: JSON文字列（boto3はstrを要求するためデコードして返す）
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # 64bitを超える整数などorjsonが扱えない値は標準ライブラリに任せる
+            pass
+    return json.dumps(data)
+
+
+def _json_loads(text: str) -> Any:
+    """
+    JSON文字列のパース（orjson.JSONDecodeErrorはjson.JSONDecodeErrorのサブクラス）
+    
+    Args:
+        text: JSON文字列
+        
+    Returns:
+        Any: パース結果
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _get_shared_client(local_endpoint: str,
+                       region_name: str,
+                       aws_access_key_id: str,
+                       aws_secret_access_key: str):
+    """
+    共有boto3クライアントの取得（未作成の場合は作成）
+    
+    Args:
+        local_endpoint: Step Functions Localのエンドポイント
+        region_name: AWSリージョン名
+        aws_access_key_id: アクセスキー
+        aws_secret_access_key: シークレットキー
+        
+    Returns:
+        Step Functionsクライアント
+    """
+    key = (local_endpoint, region_name, aws_access_key_id, aws_secret_access_key)
+    
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            global _SESSION
+            if _SESSION is None:
+                _SESSION = boto3.session.Session()
+            # Sessionはスレッドセーフではないため、ロック内でクライアントを生成する
+            client = _SESSION.client(
+                'stepfunctions',
+                endpoint_url=local_endpoint,
+                region_name=region_name,
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                config=_CLIENT_CONFIG
+            )
+            _CLIENT_CACHE[key] = client
+    
+    return client
+
 
 class StepFunctionsLocalClient:
     """
@@ -40,19 +159,18 @@ class StepFunctionsLocalClient:
         self.region_name = region_name
         
         try:
-            # Step Functions Localクライアントの作成
-            self.client = boto3.client(
-                'stepfunctions',
-                endpoint_url=local_endpoint,
-                region_name=region_name,
-                aws_access_key_id=aws_access_key_id,
-                aws_secret_access_key=aws_secret_access_key
+            # Step Functions Localクライアントの取得（同じ接続先では共有）
+            self.client = _get_shared_client(
+                local_endpoint,
+                region_name,
+                aws_access_key_id,
+                aws_secret_access_key
             )
             
-            logger.info(f"Step Functions Local client initialized with endpoint: {local_endpoint}")
+            logger.info("Step Functions Local client initialized with endpoint: %s", local_endpoint)
             
         except Exception as e:
-            logger.error(f"Failed to initialize Step Functions Local client: {str(e)}")
+            logger.error("Failed to initialize Step Functions Local client: %s", e)
             raise
     
     def test_connection(self) -> bool:
@@ -69,37 +187,41 @@ class StepFunctionsLocalClient:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to connect to Step Functions Local: {str(e)}")
+            logger.error("Failed to connect to Step Functions Local: %s", e)
             return False
     
     def create_state_machine(self, 
                            name: str, 
-                           definition: Dict[str, Any], 
+                           definition: Union[Dict[str, Any], str], 
                            role_arn: str) -> Optional[str]:
         """
         ステートマシンの作成
         
         Args:
             name: ステートマシン名
-            definition: ステートマシン定義
+            definition: ステートマシン定義（JSON文字列の場合はそのまま送信）
             role_arn: 実行ロールARN
             
         Returns:
             Optional[str]: 作成されたステートマシンのARN
         """
         try:
+            # 定義ファイルから読み込んだ文字列などは再シリアライズしない
+            if not isinstance(definition, str):
+                definition = _json_dumps(definition)
+            
             response = self.client.create_state_machine(
                 name=name,
-                definition=json.dumps(definition),
+                definition=definition,
                 roleArn=role_arn
             )
             
             state_machine_arn = response['stateMachineArn']
-            logger.info(f"State machine created successfully: {state_machine_arn}")
+            logger.info("State machine created successfully: %s", state_machine_arn)
             return state_machine_arn
             
         except ClientError as e:
-            logger.error(f"Failed to create state machine: {str(e)}")
+            logger.error("Failed to create state machine: %s", e)
             return None
     
     def start_execution(self, 
@@ -125,15 +247,15 @@ class StepFunctionsLocalClient:
             response = self.client.start_execution(
                 stateMachineArn=state_machine_arn,
                 name=execution_name,
-                input=json.dumps(input_data)
+                input=_json_dumps(input_data)
             )
             
             execution_arn = response['executionArn']
-            logger.info(f"Execution started successfully: {execution_arn}")
+            logger.info("Execution started successfully: %s", execution_arn)
             return execution_arn
             
         except ClientError as e:
-            logger.error(f"Failed to start execution: {str(e)}")
+            logger.error("Failed to start execution: %s", e)
             return None
     
     def get_execution_status(self, execution_arn: str) -> Optional[Dict[str, Any]]:
@@ -153,15 +275,15 @@ class StepFunctionsLocalClient:
                 'status': response['status'],
                 'startDate': response.get('startDate'),
                 'stopDate': response.get('stopDate'),
-                'input': json.loads(response.get('input', '{}')),
-                'output': json.loads(response.get('output', '{}')) if response.get('output') else None,
+                'input': _json_loads(response.get('input', '{}')),
+                'output': _json_loads(response['output']) if response.get('output') else None,
                 'executionArn': execution_arn
             }
             
             return status_info
             
         except ClientError as e:
-            logger.error(f"Failed to get execution status: {str(e)}")
+            logger.error("Failed to get execution status: %s", e)
             return None
     
     def wait_for_execution_completion(self, 
@@ -179,49 +301,63 @@ class StepFunctionsLocalClient:
         Returns:
             Optional[Dict]: 最終実行ステータス
         """
-        start_time = time.time()
+        waiter = create_waiter_with_client(_EXECUTION_COMPLETE_WAITER, _WAITER_MODEL, self.client)
         
-        while time.time() - start_time < timeout_seconds:
-            status_info = self.get_execution_status(execution_arn)
-            
-            if status_info is None:
-                logger.error("Failed to get execution status during wait")
+        try:
+            waiter.wait(
+                executionArn=execution_arn,
+                WaiterConfig={
+                    'Delay': poll_interval,
+                    'MaxAttempts': max(1, math.ceil(timeout_seconds / poll_interval))
+                }
+            )
+        except WaiterError as e:
+            if 'Error' in e.last_response:
+                logger.error("Failed to get execution status during wait: %s", e)
                 return None
-            
-            status = status_info['status']
-            
-            if status in ['SUCCEEDED', 'FAILED', 'TIMED_OUT', 'ABORTED']:
-                logger.info(f"Execution completed with status: {status}")
-                return status_info
-            
-            logger.debug(f"Execution status: {status}, waiting...")
-            time.sleep(poll_interval)
+            logger.warning("Execution did not complete within %s seconds", timeout_seconds)
+            return self.get_execution_status(execution_arn)
         
-        logger.warning(f"Execution did not complete within {timeout_seconds} seconds")
-        return self.get_execution_status(execution_arn)
+        status_info = self.get_execution_status(execution_arn)
+        if status_info is not None:
+            logger.info("Execution completed with status: %s", status_info['status'])
+        return status_info
     
-    def get_execution_history(self, execution_arn: str) -> Optional[List[Dict[str, Any]]]:
+    def get_execution_history(self,
+                              execution_arn: str,
+                              include_execution_data: bool = True) -> Optional[List[Dict[str, Any]]]:
         """
         実行履歴の取得
         
         Args:
             execution_arn: 実行ARN
+            include_execution_data: 入出力データを含めるかどうか
             
         Returns:
-            Optional[List[Dict]]: 実行履歴イベントのリスト
+            Optional[List[Dict]]: 実行履歴イベントのリスト（時系列順）
         """
         try:
-            response = self.client.get_execution_history(executionArn=execution_arn)
-            events = response.get('events', [])
+            # 長いワークフローでも切り捨てられないよう全ページを取得する
+            pages = self.client.get_paginator('get_execution_history').paginate(
+                executionArn=execution_arn,
+                includeExecutionData=include_execution_data,
+                reverseOrder=False,
+                PaginationConfig={'PageSize': 1000}
+            )
+            events = list(chain.from_iterable(page.get('events', []) for page in pages))
             
-            # イベントを時系列順にソート
-            sorted_events = sorted(events, key=lambda x: x.get('timestamp', datetime.min))
+            # Step Functionsは時系列順に返すため通常は並べ替え不要
+            # 順序が崩れている場合のみインプレースでソートする
+            by_timestamp = itemgetter('timestamp')
+            if any(by_timestamp(prev) > by_timestamp(event)
+                   for prev, event in zip(events, islice(events, 1, None))):
+                events.sort(key=by_timestamp)
             
-            logger.info(f"Retrieved {len(sorted_events)} execution history events")
-            return sorted_events
+            logger.info("Retrieved %s execution history events", len(events))
+            return events
             
         except ClientError as e:
-            logger.error(f"Failed to get execution history: {str(e)}")
+            logger.error("Failed to get execution history: %s", e)
             return None
     
     def stop_execution(self, execution_arn: str, error: str = "Manual stop", cause: str = "Test stopped") -> bool:
@@ -243,11 +379,11 @@ class StepFunctionsLocalClient:
                 cause=cause
             )
             
-            logger.info(f"Execution stopped successfully: {execution_arn}")
+            logger.info("Execution stopped successfully: %s", execution_arn)
             return True
             
         except ClientError as e:
-            logger.error(f"Failed to stop execution: {str(e)}")
+            logger.error("Failed to stop execution: %s", e)
             return False
     
     def list_executions(self, state_machine_arn: str, status_filter: Optional[str] = None) -> Optional[List[Dict[str, Any]]]:
@@ -269,11 +405,11 @@ class StepFunctionsLocalClient:
             response = self.client.list_executions(**params)
             executions = response.get('executions', [])
             
-            logger.info(f"Retrieved {len(executions)} executions")
+            logger.info("Retrieved %s executions", len(executions))
             return executions
             
         except ClientError as e:
-            logger.error(f"Failed to list executions: {str(e)}")
+            logger.error("Failed to list executions: %s", e)
             return None
 
 
@@ -303,9 +439,13 @@ class WorkflowExecutionMonitor:
         Returns:
             Dict: 詳細な監視結果
         """
+        # 壁時計は開始時に1回だけ取得し、終了時刻は単調時計の経過時間から求める
+        # （監視中にNTP補正で時計が飛んでも開始・終了時刻の前後関係が崩れない）
+        started_at = datetime.now()
+        started = time.monotonic()
         monitoring_result = {
             'executionArn': execution_arn,
-            'startTime': datetime.now().isoformat(),
+            'startTime': started_at.isoformat(),
             'events': [],
             'stateOutputs': {},
             'dataFlow': [],
@@ -327,78 +467,88 @@ class WorkflowExecutionMonitor:
             
             if history:
                 monitoring_result['events'] = history
-                monitoring_result['stateOutputs'] = self._extract_state_outputs(history)
-                monitoring_result['dataFlow'] = self._trace_data_flow(history)
+                state_outputs, data_flow = self._analyze_history(history)
+                monitoring_result['stateOutputs'] = state_outputs
+                monitoring_result['dataFlow'] = data_flow
             
-            monitoring_result['endTime'] = datetime.now().isoformat()
+            monitoring_result['endTime'] = (
+                started_at + timedelta(seconds=time.monotonic() - started)
+            ).isoformat()
             
         except Exception as e:
-            self.logger.error(f"Error during execution monitoring: {str(e)}")
+            self.logger.error("Error during execution monitoring: %s", e)
             monitoring_result['errors'].append(str(e))
         
         return monitoring_result
     
-    def _extract_state_outputs(self, history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def monitor_many_sync(self,
+                          execution_arns: List[str],
+                          max_workers: int = 16) -> Dict[str, Dict[str, Any]]:
         """
-        実行履歴からステート出力を抽出
+        複数実行の並列監視
+        
+        boto3クライアントはスレッドセーフなため、共有クライアントのまま
+        スレッドプールで各実行の監視を並行して行う
         
         Args:
-            history: 実行履歴イベント
+            execution_arns: 実行ARNのリスト
+            max_workers: 最大並列数
             
         Returns:
-            Dict: ステート別出力データ
+            Dict[str, Dict]: 実行ARN別の詳細な監視結果
         """
-        state_outputs = {}
-        
-        for event in history:
-            event_type = event.get('type')
-            
-            if event_type == 'TaskStateExited':
-                state_name = event.get('stateExitedEventDetails', {}).get('name')
-                output = event.get('stateExitedEventDetails', {}).get('output')
-                
-                if state_name and output:
-                    try:
-                        state_outputs[state_name] = json.loads(output)
-                    except json.JSONDecodeError:
-                        state_outputs[state_name] = output
+        if not execution_arns:
+            return {}
         
-        return state_outputs
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(execution_arns)))) as executor:
+            results = executor.map(self.monitor_execution_with_details, execution_arns)
+            return dict(zip(execution_arns, results))
     
-    def _trace_data_flow(self, history: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # 追跡対象のイベント種別 -> (詳細キー, データキー)
+    _FLOW_EVENTS = {
+        'TaskStateEntered': ('stateEnteredEventDetails', 'input'),
+        'TaskStateExited': ('stateExitedEventDetails', 'output'),
+    }
+    
+    def _analyze_history(self, history: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
         """
-        データフローの追跡
+        実行履歴を1回の走査で解析し、ステート出力とデータフローを抽出
         
         Args:
             history: 実行履歴イベント
             
         Returns:
-            List[Dict]: データフロー情報
+            Tuple[Dict, List[Dict]]: ステート別出力データとデータフロー情報
         """
+        state_outputs = {}
         data_flow = []
+        flow_events = self._FLOW_EVENTS
         
         for event in history:
             event_type = event.get('type')
+            flow_event = flow_events.get(event_type)
+            
+            if flow_event is None:
+                continue
+            
+            details_key, data_key = flow_event
+            details = event.get(details_key, {})
+            state_name = details.get('name')
+            data = details.get(data_key)
             timestamp = event.get('timestamp')
             
-            if event_type in ['TaskStateEntered', 'TaskStateExited']:
-                flow_entry = {
-                    'timestamp': timestamp.isoformat() if timestamp else None,
-                    'eventType': event_type,
-                    'stateName': None,
-                    'data': None
-                }
-                
-                if event_type == 'TaskStateEntered':
-                    details = event.get('stateEnteredEventDetails', {})
-                    flow_entry['stateName'] = details.get('name')
-                    flow_entry['data'] = details.get('input')
-                
-                elif event_type == 'TaskStateExited':
-                    details = event.get('stateExitedEventDetails', {})
-                    flow_entry['stateName'] = details.get('name')
-                    flow_entry['data'] = details.get('output')
-                
-                data_flow.append(flow_entry)
+            data_flow.append({
+                'timestamp': timestamp.isoformat() if timestamp else None,
+                'eventType': event_type,
+                'stateName': state_name,
+                'data': data
+            })
+            
+            # ステート出力は終了イベントからのみ抽出
+            if data_key == 'output' and state_name and data:
+                try:
+                    state_outputs[state_name] = _json_loads(data)
+                except json.JSONDecodeError:
+                    state_outputs[state_name] = data
         
-        return data_flow
\ No newline at end of file
+        return state_outputs, data_flow
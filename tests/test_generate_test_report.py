@@ -0,0 +1,66 @@
+"""
+テストレポート生成スクリプト（scripts/generate_test_report.py）の単体テスト
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPORT_PATH = Path(__file__).resolve().parent.parent / 'scripts' / 'generate_test_report.py'
+_spec = importlib.util.spec_from_file_location('generate_test_report', _REPORT_PATH)
+generate_test_report = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault(_spec.name, generate_test_report)
+_spec.loader.exec_module(generate_test_report)
+
+_BLOCK = 16
+
+
+def _write_log(tmp_path, size, trailing_newline=True):
+    """指定バイト数の複数行ログファイルを作成"""
+    lines = []
+    total = 0
+    index = 0
+    while total < size:
+        line = f'line{index}\n'
+        lines.append(line)
+        total += len(line)
+        index += 1
+    content = ''.join(lines)[:size]
+    if not trailing_newline and content.endswith('\n'):
+        content = content[:-1] + 'x'
+    path = tmp_path / 'test.log'
+    path.write_bytes(content.encode('utf-8'))
+    return path, content
+
+
+@pytest.mark.unit
+class TestTail:
+    """_tail関数のテスト"""
+    
+    @pytest.mark.parametrize('size', [0, 5, _BLOCK - 1, _BLOCK, _BLOCK + 1, _BLOCK * 2, _BLOCK * 10 + 3])
+    @pytest.mark.parametrize('trailing_newline', [True, False])
+    @pytest.mark.parametrize('n', [1, 3, 10])
+    def test_matches_full_read(self, tmp_path, size, trailing_newline, n):
+        """ブロックサイズより短い・等しい・長いファイルで、全体を読んだ場合と同じ末尾n行を返すこと"""
+        path, content = _write_log(tmp_path, size, trailing_newline)
+        
+        result = generate_test_report._tail(str(path), n=n, block=_BLOCK)
+        
+        assert result == content.splitlines()[-n:]
+    
+    def test_long_line_spanning_blocks(self, tmp_path):
+        """ブロックサイズを超える長い行も欠けずに返すこと"""
+        path = tmp_path / 'test.log'
+        long_line = 'x' * (_BLOCK * 3)
+        path.write_text(f'first\n{long_line}\nlast\n', encoding='utf-8')
+        
+        assert generate_test_report._tail(str(path), n=2, block=_BLOCK) == [long_line, 'last']
+    
+    def test_crlf_and_invalid_utf8(self, tmp_path):
+        """CRLF改行を除去し、不正なUTF-8は置換文字で返すこと"""
+        path = tmp_path / 'test.log'
+        path.write_bytes(b'a\r\nb\xff\r\nc\r\n')
+        
+        assert generate_test_report._tail(str(path), n=2, block=_BLOCK) == ['b�', 'c']
@@ -0,0 +1,300 @@
+"""
+入出力検証ロジックの単体テスト
+Step Functions Localに接続せずに、検証仕様と各検証メソッドの動作を確認する
+"""
+
+import copy
+
+import pytest
+
+try:
+    import input_output_validator as iov
+except ImportError:  # pragma: no cover - fallback for package imports
+    from . import input_output_validator as iov
+
+
+def _valid_workflow():
+    """正常なワークフロー入力と各ステート出力を生成"""
+    workflow_input = {
+        'requestId': 'test-001',
+        'inputData': {'value': 'v', 'metadata': {'source': 'test'}}
+    }
+    state1_output = {
+        'requestId': 'test-001',
+        'state1Output': {'processedValue': 'State1_processed_v', 'originalInput': 'v'},
+        'stateMetadata': {'state': 'State1', 'executionTime': '2024-01-01T00:00:00'}
+    }
+    state2_output = {
+        'requestId': 'test-001',
+        'state1Output': copy.deepcopy(state1_output['state1Output']),
+        'state2Output': {
+            'processedValue': 'State2_enhanced_State1_processed_v',
+            'previousStateData': {},
+            'enhancementData': {}
+        },
+        'stateMetadata': {'state': 'State2', 'executionTime': '2024-01-01T00:00:01'},
+        'dataFlow': {'inputSource': 'State1', 'outputDestination': 'State3', 'dataTransformation': 'enhance'}
+    }
+    state3_output = {
+        'requestId': 'test-001',
+        'executionSummary': {'totalStates': 3, 'executionStatus': 'COMPLETED'},
+        'allStatesData': {
+            'state1Output': copy.deepcopy(state1_output['state1Output']),
+            'state2Output': copy.deepcopy(state2_output['state2Output']),
+            'state3Output': {}
+        },
+        'finalResult': {
+            'success': True,
+            'finalValue': 'State3_final_State2_enhanced_State1_processed_v',
+            'processingChain': ['State1', 'State2', 'State3']
+        },
+        'stateMetadata': {'state': 'State3', 'executionTime': '2024-01-01T00:00:02'}
+    }
+    return workflow_input, state1_output, state2_output, state3_output
+
+
+def _run_check(name, data, arg=None):
+    """検証関数を直接実行し、(エラー, 警告, 子ノード) を返す"""
+    errors, warnings = [], []
+    children = iov._NODE_CHECKS[name](data, arg, errors, warnings)
+    return errors, warnings, children
+
+
+@pytest.mark.unit
+class TestNodeSpecs:
+    """検証仕様（_NODE_SPECS）から組み立てた検証関数のテスト"""
+    
+    def test_valid_nodes_have_no_errors(self):
+        """正常なデータでは全ルートノードがエラー・警告なし"""
+        workflow_input, state1_output, state2_output, state3_output = _valid_workflow()
+        for name, data in (('workflow_input', workflow_input), ('state1', state1_output),
+                           ('state2', state2_output), ('state3', state3_output)):
+            errors, warnings, _ = _run_check(name, data)
+            assert errors == [] and warnings == [], f"{name}: {errors} {warnings}"
+    
+    def test_required_reports_missing_fields_in_spec_order(self):
+        """required: 欠落したフィールドを仕様の記載順に報告"""
+        errors, _, _ = _run_check('state1', {})
+        assert errors == [
+            "Required field 'requestId' is missing from State1 output",
+            "Required field 'state1Output' is missing from State1 output",
+            "Required field 'stateMetadata' is missing from State1 output",
+        ]
+    
+    def test_non_empty_str(self):
+        """non_empty_str: 空白のみの文字列・文字列以外はエラー"""
+        for value in ('  ', 1):
+            errors, _, _ = _run_check('workflow_input', {'requestId': value, 'inputData': {'value': 'v'}})
+            assert errors == ["requestId must be a non-empty string"]
+    
+    def test_dict_child(self):
+        """dict_child: 辞書でなければエラー、辞書なら子ノードの検証を追加"""
+        errors, _, children = _run_check('workflow_input', {'requestId': 'r', 'inputData': 'x'})
+        assert errors == ["inputData must be a dictionary"]
+        assert children == []
+        
+        input_data = {'value': 'v'}
+        errors, _, children = _run_check('workflow_input', {'requestId': 'r', 'inputData': input_data})
+        assert errors == []
+        assert children == [('input_data', input_data, None)]
+    
+    def test_str_prefix(self):
+        """str_prefix: 文字列以外はエラー、プレフィックス不一致は警告"""
+        errors, warnings, _ = _run_check('state1_structure', {'processedValue': 1, 'originalInput': 'v'})
+        assert errors == ["processedValue must be a string"] and warnings == []
+        
+        errors, warnings, _ = _run_check('state1_structure', {'processedValue': 'x', 'originalInput': 'v'})
+        assert errors == [] and warnings == ["processedValue does not follow expected naming pattern"]
+    
+    def test_is_type(self):
+        """is_type: フィールドが存在する場合のみ型を確認"""
+        errors, _, _ = _run_check('input_data', {'value': 'v', 'metadata': []})
+        assert errors == ["metadata must be a dictionary"]
+        errors, _, _ = _run_check('input_data', {'value': 'v'})
+        assert errors == []
+        errors, _, _ = _run_check('final_result', {'success': 'yes', 'finalValue': 'x', 'processingChain': []})
+        assert errors == ["success field must be boolean"]
+    
+    def test_equals_with_parent_argument(self):
+        """equals: 親ノードから渡された期待値との比較とメッセージの整形"""
+        errors, _, _ = _run_check('state_metadata', {'state': 'State2', 'executionTime': 't'}, 'State1')
+        assert errors == ["Expected state 'State1', got 'State2'"]
+    
+    def test_equals_with_literal(self):
+        """equals: 仕様に記載した期待値との比較とメッセージの整形"""
+        errors, _, _ = _run_check('execution_summary', {'totalStates': 2, 'executionStatus': 'COMPLETED'})
+        assert errors == ["Expected 3 total states, got 2"]
+    
+    def test_child_passes_argument(self):
+        """child: 子ノードの検証を仕様の引数付きで追加"""
+        _, state1_output, _, _ = _valid_workflow()
+        _, _, children = _run_check('state1', state1_output)
+        assert children == [
+            ('state1_structure', state1_output['state1Output'], None),
+            ('state_metadata', state1_output['stateMetadata'], 'State1'),
+        ]
+    
+    def test_collapse(self):
+        """collapse: 子の検証エラーを1件にまとめる"""
+        errors, warnings, _ = _run_check('state1_preserved', {'processedValue': 1})
+        assert errors == ["State1 output data is not properly preserved in State2 output"]
+        assert warnings == []
+    
+    def test_all_equals_templates_format(self):
+        """全てのequalsメッセージがstr.formatで整形できる"""
+        for name, ops in iov._NODE_SPECS.items():
+            for op in ops:
+                if op[0] == 'equals':
+                    assert op[3].format(expected='e', actual='a'), name
+    
+    def test_unknown_op_is_rejected(self):
+        """未知の検証操作はValueError"""
+        with pytest.raises(ValueError):
+            iov._build_validator('unknown', (('no_such_op', 'x'),))
+
+
+def _granular_errors(workflow_input, state1_output, state2_output, state3_output):
+    """個別の検証メソッドによるエラーを検証順に連結して返す"""
+    validator = iov.InputOutputValidator()
+    results = (
+        validator.validate_workflow_input(workflow_input),
+        validator.validate_state1_output(state1_output),
+        validator.validate_state2_output(state2_output),
+        validator.validate_state3_output(state3_output),
+        iov.DataFlowValidator().validate_data_flow_continuity(
+            workflow_input, state1_output, state2_output, state3_output
+        ),
+    )
+    return [error for result in results for error in result.errors]
+
+
+def _invalid_workflows():
+    """不正なワークフロー（入力・各ステート出力のいずれかを改変したもの）を生成"""
+    def mutate(index, change):
+        workflow = _valid_workflow()
+        change(workflow[index])
+        return workflow
+    
+    return [
+        mutate(0, lambda d: d.pop('requestId')),
+        mutate(0, lambda d: d['inputData'].update(metadata=[])),
+        mutate(1, lambda d: d['state1Output'].update(processedValue='wrong')),
+        mutate(1, lambda d: d['stateMetadata'].update(state='State2')),
+        mutate(2, lambda d: d.update(requestId='other')),
+        mutate(2, lambda d: d.pop('dataFlow')),
+        mutate(2, lambda d: d['state1Output'].update(processedValue=1)),
+        mutate(3, lambda d: d['executionSummary'].update(totalStates=2)),
+        mutate(3, lambda d: d['finalResult'].update(finalValue='State3_final_x')),
+        mutate(3, lambda d: d['allStatesData'].pop('state3Output')),
+    ]
+
+
+@pytest.mark.unit
+class TestFusedValidator:
+    """一括検証関数（validate_all）と個別の検証メソッドの整合性テスト"""
+    
+    def test_valid_workflow(self):
+        """正常なワークフローでは一括検証・個別検証ともにエラーなし"""
+        workflow = _valid_workflow()
+        assert iov.validate_all(*workflow) == []
+        assert _granular_errors(*workflow) == []
+    
+    @pytest.mark.parametrize('workflow', _invalid_workflows())
+    def test_invalid_workflow_matches_granular(self, workflow):
+        """不正なワークフローでは個別検証と同じエラーを同じ順序で返す"""
+        errors = iov.validate_all(*workflow)
+        assert errors, "Invalid workflow should have errors"
+        assert errors == _granular_errors(*workflow)
+    
+    @pytest.mark.parametrize('workflow', [_valid_workflow()] + _invalid_workflows())
+    def test_detailed_validation_matches_granular(self, workflow):
+        """WorkflowExecutionTesterの詳細検証は一括検証の有無によらず個別検証と同じ結果"""
+        try:
+            from workflow_execution_test import WorkflowExecutionTester
+            from stepfunctions_local_client import StepFunctionsLocalClient
+        except ImportError:  # pragma: no cover - fallback for package imports
+            from .workflow_execution_test import WorkflowExecutionTester
+            from .stepfunctions_local_client import StepFunctionsLocalClient
+        
+        workflow_input, state1_output, state2_output, state3_output = workflow
+        tester = WorkflowExecutionTester(
+            StepFunctionsLocalClient(local_endpoint='http://localhost:8083'),
+            'arn:aws:states:us-east-1:123456789012:stateMachine:test'
+        )
+        results = tester._perform_detailed_validation(
+            workflow_input, state3_output, {'State1': state1_output, 'State2': state2_output}
+        )
+        
+        validator = iov.InputOutputValidator()
+        expected = [
+            validator.validate_state3_output(state3_output),
+            validator.validate_state1_output(state1_output),
+            validator.validate_state2_output(state2_output),
+            iov.DataFlowValidator().validate_data_flow_continuity(
+                workflow_input, state1_output, state2_output, state3_output
+            ),
+        ]
+        
+        def summary(result):
+            return result.is_valid, list(result.errors), list(result.warnings)
+        
+        assert [summary(r) for r in results] == [summary(r) for r in expected]
+
+
+@pytest.mark.unit
+class TestFailFast:
+    """fail_fastオプションのテスト"""
+    
+    def _state3_with_two_child_errors(self):
+        _, _, _, state3_output = _valid_workflow()
+        state3_output['executionSummary']['totalStates'] = 2
+        state3_output['finalResult']['success'] = 'yes'
+        return state3_output
+    
+    def test_collects_all_errors_by_default(self):
+        """既定では全ての子ノードのエラーを収集"""
+        result = iov.InputOutputValidator().validate_state3_output(self._state3_with_two_child_errors())
+        assert not result.is_valid
+        assert list(result.errors) == ["Expected 3 total states, got 2", "success field must be boolean"]
+    
+    def test_stops_after_first_error(self):
+        """fail_fast=Trueでは最初にエラーが発生したノードで検証を打ち切る"""
+        result = iov.InputOutputValidator().validate_state3_output(
+            self._state3_with_two_child_errors(), fail_fast=True
+        )
+        assert isinstance(result, iov.ValidationResult)
+        assert not result.is_valid
+        assert result.errors == ("Expected 3 total states, got 2",)
+        assert isinstance(result.errors, tuple)
+        assert result.validated_data is None
+    
+    def test_valid_data_is_unaffected(self):
+        """正常なデータではfail_fastの有無で結果が変わらない"""
+        validator = iov.InputOutputValidator()
+        workflow_input, state1_output, state2_output, state3_output = _valid_workflow()
+        for validate, data in ((validator.validate_workflow_input, workflow_input),
+                               (validator.validate_state1_output, state1_output),
+                               (validator.validate_state2_output, state2_output),
+                               (validator.validate_state3_output, state3_output)):
+            assert validate(data, fail_fast=True) == validate(data)
+            assert validate(data, fail_fast=True).validated_data is data
+
+
+@pytest.mark.unit
+class TestValidateBatch:
+    """DataFlowValidator.validate_batchのテスト"""
+    
+    def test_matches_per_item_validation(self):
+        """validate_batchは各ワークフローを個別に検証した結果と同じ結果を同じ順序で返す"""
+        workflows = [_valid_workflow()] + _invalid_workflows() + [_valid_workflow()]
+        validator = iov.DataFlowValidator()
+        
+        results = validator.validate_batch(workflows)
+        
+        assert results == [validator.validate_data_flow_continuity(*workflow) for workflow in workflows]
+        assert results[0].is_valid and results[-1].is_valid
+        assert any(not result.is_valid for result in results)
+    
+    def test_empty_batch(self):
+        """空のバッチでは空のリストを返す"""
+        assert iov.DataFlowValidator().validate_batch([]) == []
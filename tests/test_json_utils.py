@@ -0,0 +1,79 @@
+"""
+Lambda関数共通ユーティリティ（src/json_utils.py）の単体テスト
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+_SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+
+def _load_src_module(name, monkeypatch):
+    """src配下のモジュールを読み込む（Lambdaと同様にsrcを検索パスに追加する）"""
+    monkeypatch.syspath_prepend(str(_SRC_DIR))
+    spec = importlib.util.spec_from_file_location(f'_src_{name}', _SRC_DIR / f'{name}.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.unit
+class TestValidateWhileWarming:
+    """validate_while_warmingデコレータのテスト"""
+    
+    def _counting_validator(self, json_utils):
+        calls = []
+        
+        @json_utils.validate_while_warming
+        def validate(event):
+            calls.append(event)
+            return False
+        
+        return validate, calls
+    
+    def test_validates_every_call_by_default(self, monkeypatch):
+        """SKIP_VALIDATION未設定の場合は毎回検証すること"""
+        monkeypatch.delenv('SKIP_VALIDATION', raising=False)
+        json_utils = _load_src_module('json_utils', monkeypatch)
+        validate, calls = self._counting_validator(json_utils)
+        
+        results = [validate({'n': i}) for i in range(5)]
+        
+        assert results == [False] * 5
+        assert len(calls) == 5
+    
+    def test_skips_after_first_invocations(self, monkeypatch):
+        """SKIP_VALIDATION=1の場合は最初の3回のみ検証し、以降は省略すること"""
+        monkeypatch.setenv('SKIP_VALIDATION', '1')
+        json_utils = _load_src_module('json_utils', monkeypatch)
+        validate, calls = self._counting_validator(json_utils)
+        
+        results = [validate({'n': i}) for i in range(5)]
+        
+        assert json_utils.FULL_VALIDATION_INVOCATIONS == 3
+        assert results == [False, False, False, True, True]
+        assert calls == [{'n': 0}, {'n': 1}, {'n': 2}]
+    
+    def test_counts_per_decorated_function(self, monkeypatch):
+        """呼び出し回数は検証関数ごとに数えること"""
+        monkeypatch.setenv('SKIP_VALIDATION', '1')
+        json_utils = _load_src_module('json_utils', monkeypatch)
+        first, _ = self._counting_validator(json_utils)
+        second, second_calls = self._counting_validator(json_utils)
+        
+        for _ in range(5):
+            first({})
+        
+        assert second({}) is False
+        assert len(second_calls) == 1
+    
+    def test_state_handler_uses_helper(self, monkeypatch):
+        """State1の入力検証が最初の3回のみ不正な入力を検出すること"""
+        monkeypatch.setenv('SKIP_VALIDATION', '1')
+        state1 = _load_src_module('state1', monkeypatch)
+        
+        results = [state1.validate_input({}) for _ in range(5)]
+        
+        assert results == [False, False, False, True, True]
@@ -0,0 +1,171 @@
+"""
+Step Functions実行待機処理（scripts/_sfn_waiter.py）の単体テスト
+botocoreのStubberでdescribe_executionの応答を差し替え、実際の待機は行わない
+"""
+
+import importlib.util
+import sys
+from datetime import datetime
+from types import SimpleNamespace
+from pathlib import Path
+
+import boto3
+import pytest
+from botocore.stub import Stubber
+
+_WAITER_PATH = Path(__file__).resolve().parent.parent / 'scripts' / '_sfn_waiter.py'
+_spec = importlib.util.spec_from_file_location('_sfn_waiter', _WAITER_PATH)
+sfn_waiter = importlib.util.module_from_spec(_spec)
+sys.modules.setdefault(_spec.name, sfn_waiter)
+_spec.loader.exec_module(sfn_waiter)
+
+EXECUTION_ARN = 'arn:aws:states:us-east-1:123456789012:execution:Workflow:test-001'
+STATE_MACHINE_ARN = 'arn:aws:states:us-east-1:123456789012:stateMachine:Workflow'
+
+
+def _describe_response(status, output=None):
+    """describe_executionの応答を生成"""
+    response = {
+        'executionArn': EXECUTION_ARN,
+        'stateMachineArn': STATE_MACHINE_ARN,
+        'status': status,
+        'startDate': datetime(2024, 1, 1),
+    }
+    if output is not None:
+        response['output'] = output
+    return response
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """time.sleepで進む仮想時計（sleep時間の記録付き）"""
+    clock = {'now': 0.0, 'sleeps': []}
+    
+    def _sleep(seconds):
+        clock['sleeps'].append(seconds)
+        clock['now'] += seconds
+    
+    monkeypatch.setattr(sfn_waiter, 'time', SimpleNamespace(monotonic=lambda: clock['now'], sleep=_sleep))
+    # ジッターを無効化し、待機時間を上限値に固定する
+    monkeypatch.setattr(sfn_waiter, 'random', SimpleNamespace(uniform=lambda low, high: high))
+    return clock
+
+
+@pytest.fixture
+def stubbed_client():
+    """describe_executionをStubberで差し替えたStep Functionsクライアント"""
+    client = boto3.client(
+        'stepfunctions',
+        region_name='us-east-1',
+        aws_access_key_id='dummy',
+        aws_secret_access_key='dummy',
+    )
+    with Stubber(client) as stubber:
+        yield client, stubber
+        stubber.assert_no_pending_responses()
+
+
+def _queue(stubber, *responses):
+    for response in responses:
+        stubber.add_response('describe_execution', response, {'executionArn': EXECUTION_ARN})
+
+
+@pytest.mark.unit
+class TestExecutionCompletedWaiter:
+    """ExecutionCompletedWaiterのテスト"""
+    
+    def test_returns_on_success_with_output(self, stubbed_client, fake_clock):
+        """RUNNINGの後SUCCEEDEDになった時点で応答を返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, _describe_response('RUNNING'), _describe_response('SUCCEEDED', '{}'))
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN)
+        
+        assert response['status'] == 'SUCCEEDED'
+        assert response['output'] == '{}'
+        assert fake_clock['sleeps'] == [sfn_waiter.DEFAULT_CONFIG.Delay]
+    
+    @pytest.mark.parametrize('status', ['FAILED', 'TIMED_OUT', 'ABORTED'])
+    def test_returns_on_failure_states(self, stubbed_client, fake_clock, status):
+        """失敗系の終了状態は出力がなくても即座に返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, _describe_response(status))
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN)
+        
+        assert response['status'] == status
+        assert fake_clock['sleeps'] == []
+    
+    def test_backoff_is_capped_by_max_delay(self, stubbed_client, fake_clock):
+        """待機間隔が倍増し、MaxDelayで頭打ちになること"""
+        client, stubber = stubbed_client
+        _queue(stubber, *[_describe_response('RUNNING')] * 4, _describe_response('SUCCEEDED', '{}'))
+        config = sfn_waiter.WaiterConfig(Delay=1.0, MaxDelay=3.0)
+        
+        sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+        
+        assert fake_clock['sleeps'] == [1.0, 2.0, 3.0, 3.0]
+    
+    def test_retries_succeeded_without_output(self, stubbed_client, fake_clock):
+        """出力が未反映のSUCCEEDEDは再取得し、出力が得られた応答を返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, _describe_response('SUCCEEDED'), _describe_response('SUCCEEDED', '{"ok": true}'))
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN)
+        
+        assert response['output'] == '{"ok": true}'
+    
+    def test_output_retries_exhausted_returns_last_response(self, stubbed_client, fake_clock):
+        """OutputRetriesを使い切った場合は出力なしのSUCCEEDEDをそのまま返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, *[_describe_response('SUCCEEDED')] * 3)
+        config = sfn_waiter.WaiterConfig(OutputRetries=2)
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+        
+        assert response['status'] == 'SUCCEEDED'
+        assert 'output' not in response
+        assert len(fake_clock['sleeps']) == 2
+    
+    def test_max_attempts_after_success_returns_response(self, stubbed_client, fake_clock):
+        """出力待ちのSUCCEEDED中にMaxAttemptsを使い切った場合はタイムアウトにせず応答を返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, _describe_response('SUCCEEDED'))
+        config = sfn_waiter.WaiterConfig(MaxAttempts=1)
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+        
+        assert response['status'] == 'SUCCEEDED'
+        assert 'output' not in response
+        assert fake_clock['sleeps'] == []
+    
+    def test_deadline_after_success_returns_response(self, stubbed_client, fake_clock):
+        """出力待ちのSUCCEEDED中にTimeoutを超えた場合はタイムアウトにせず応答を返すこと"""
+        client, stubber = stubbed_client
+        _queue(stubber, _describe_response('RUNNING'), _describe_response('SUCCEEDED'))
+        config = sfn_waiter.WaiterConfig(Delay=1.0, MaxDelay=1.0, Timeout=1.5)
+        
+        response = sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+        
+        assert response['status'] == 'SUCCEEDED'
+        assert 'output' not in response
+    
+    def test_timeout_raises(self, stubbed_client, fake_clock):
+        """Timeoutを超えても終了しない場合はTimeoutErrorを送出すること"""
+        client, stubber = stubbed_client
+        _queue(stubber, *[_describe_response('RUNNING')] * 3)
+        config = sfn_waiter.WaiterConfig(Delay=1.0, MaxDelay=1.0, Timeout=2.5)
+        
+        with pytest.raises(TimeoutError, match=r'within 2\.5 seconds \(3 attempts\)'):
+            sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+    
+    def test_max_attempts_raises(self, stubbed_client, fake_clock):
+        """MaxAttempts回の取得で終了しない場合はTimeoutErrorを送出すること"""
+        client, stubber = stubbed_client
+        _queue(stubber, *[_describe_response('RUNNING')] * 2)
+        config = sfn_waiter.WaiterConfig(MaxAttempts=2)
+        
+        with pytest.raises(TimeoutError, match=r'\(2 attempts\)'):
+            sfn_waiter.ExecutionCompletedWaiter(client).wait(EXECUTION_ARN, config)
+        
+        assert len(fake_clock['sleeps']) == 1
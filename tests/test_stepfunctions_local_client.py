@@ -0,0 +1,55 @@
+"""
+Step Functions Localクライアント（stepfunctions_local_client.py）の単体テスト
+"""
+
+import threading
+
+import pytest
+
+try:
+    import stepfunctions_local_client as sfl
+except ImportError:  # pragma: no cover - fallback for package imports
+    from . import stepfunctions_local_client as sfl
+
+
+@pytest.mark.unit
+class TestMonitorManySync:
+    """WorkflowExecutionMonitor.monitor_many_syncのテスト"""
+    
+    def _monitor_completing_in_reverse(self, execution_arns):
+        """入力と逆の順序で監視が完了するモニターを生成"""
+        finished = {arn: threading.Event() for arn in execution_arns}
+        completion_order = []
+        lock = threading.Lock()
+        
+        def monitor(execution_arn):
+            index = execution_arns.index(execution_arn)
+            # 後ろの実行の完了を待ってから完了する
+            if index + 1 < len(execution_arns):
+                assert finished[execution_arns[index + 1]].wait(timeout=5)
+            with lock:
+                completion_order.append(execution_arn)
+            finished[execution_arn].set()
+            return {'executionArn': execution_arn, 'index': index}
+        
+        monitor_instance = sfl.WorkflowExecutionMonitor(client=None)
+        monitor_instance.monitor_execution_with_details = monitor
+        return monitor_instance, completion_order
+    
+    def test_results_follow_input_order(self):
+        """完了順に関わらず、入力順のキーで各実行の結果を返すこと"""
+        execution_arns = [f'arn:aws:states:us-east-1:123456789012:execution:Workflow:e{i}' for i in range(5)]
+        monitor, completion_order = self._monitor_completing_in_reverse(execution_arns)
+        
+        results = monitor.monitor_many_sync(execution_arns, max_workers=len(execution_arns))
+        
+        assert completion_order == execution_arns[::-1]
+        assert list(results) == execution_arns
+        assert [r['executionArn'] for r in results.values()] == execution_arns
+        assert [r['index'] for r in results.values()] == list(range(5))
+    
+    def test_empty_input(self):
+        """実行ARNが空の場合は空の辞書を返すこと"""
+        monitor = sfl.WorkflowExecutionMonitor(client=None)
+        
+        assert monitor.monitor_many_sync([]) == {}
@@ -6,6 +6,7 @@
 import json
 import time
 import logging
+from itertools import chain
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
@@ -17,6 +18,7 @@ try:
         DataFlowValidator,
         AssertionHelper,
         ValidationResult,
+        validate_all,
     )
 except ImportError:  # pragma: no cover - fallback for package imports
     from .stepfunctions_local_client import StepFunctionsLocalClient, WorkflowExecutionMonitor
@@ -25,6 +27,7 @@ except ImportError:  # pragma: no cover - fallback for package imports
         DataFlowValidator,
         AssertionHelper,
         ValidationResult,
+        validate_all,
     )
 
 # ログ設定
@@ -157,9 +160,8 @@ class WorkflowExecutionTester:
                 test_result.success = all(vr.is_valid for vr in validation_results)
                 
                 # エラーと警告を集約
-                for vr in validation_results:
-                    test_result.errors.extend(vr.errors)
-                    test_result.warnings.extend(vr.warnings)
+                test_result.errors.extend(chain.from_iterable(vr.errors for vr in validation_results))
+                test_result.warnings.extend(chain.from_iterable(vr.warnings for vr in validation_results))
             
             elif test_result.execution_status in ['FAILED', 'TIMED_OUT', 'ABORTED']:
                 test_result.errors.append(f"Workflow execution failed with status: {test_result.execution_status}")
@@ -198,6 +200,20 @@ class WorkflowExecutionTester:
         validation_results = []
         
         try:
+            # 全ステートの出力が取得できている場合は一括検証関数で正常系を確認し、
+            # エラーがある場合のみ個別の検証でステートごとの詳細を特定する
+            if 'State1' in state_outputs and 'State2' in state_outputs:
+                state1_output = state_outputs['State1']
+                state2_output = state_outputs['State2']
+                if not validate_all(input_data, state1_output, state2_output, final_output):
+                    self.logger.info("Workflow output validation: PASSED (all states)")
+                    return [
+                        ValidationResult(True, (), (), final_output),
+                        ValidationResult(True, (), (), state1_output),
+                        ValidationResult(True, (), (), state2_output),
+                        ValidationResult(True, (), ()),
+                    ]
+            
             # State3（最終）出力の検証
             state3_validation = self.input_validator.validate_state3_output(final_output)
             validation_results.append(state3_validation)